@@ -32,7 +32,8 @@ from datetime import date
 import google.auth
 from datetime import datetime, timezone
 from filelock import FileLock
-from typing import Optional, List, Union
+from types import MappingProxyType
+from typing import Optional, List, Union, Mapping
 from agents.file_processing_agent import FileProcessingAgent
 from agents.native_tools_agent import NativeToolsAgent
 import sqlite3
@@ -56,8 +57,17 @@ DAILY_SEARCH_QUOTA = 10000
 PROJECT_ROOT = config.PROJECT_ROOT # Already a Path object
 
 # --- PERSONA INITIALIZATION ---
-def get_db_paths(persona: str) -> dict:
-    """Returns a dictionary of database paths based on the persona."""
+_db_paths_cache = {}  # persona -> resolved paths (only personas whose folder exists)
+
+def get_db_paths(persona: str) -> Mapping[str, str]:
+    """
+    Returns a read-only mapping of database paths based on the persona.
+    Resolved paths are cached per persona; a missing folder is re-checked on every call.
+    """
+    cached = _db_paths_cache.get(persona)
+    if cached is not None:
+        return cached
+    
     databases_dir = PROJECT_ROOT / 'databases'
     persona_dir = databases_dir / persona
     
@@ -66,11 +76,13 @@ def get_db_paths(persona: str) -> dict:
         logger.error(f"  Error: '{persona}' directory not found at {persona_dir}.")
         return {}
     
-    return {
+    paths = MappingProxyType({
         "db_file": str(persona_dir / 'orion_database.sqlite'),
         "chroma_db_path": str(persona_dir / "chroma_db_store"),
         "collection_name": "orion_semantic_memory"
-    }
+    })
+    _db_paths_cache[persona] = paths
+    return paths
 
 def initialize_persona(persona: str = "default"):
     """Initializes the database paths for the given persona."""
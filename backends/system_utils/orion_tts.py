@@ -28,6 +28,7 @@ tts_thread = None
 stop_event = threading.Event()
 interrupt_event = threading.Event() # NEW: For stopping current speech
 IS_SPEAKING = False # NEW: Flag to indicate if TTS is currently speaking
+_speaking_listeners = []  # Callbacks notified (on the TTS thread) when IS_SPEAKING changes
 
 # --- 2. VALIDATE FILES & CREATE LOG FOLDER ---
 if not os.path.exists(MODEL_PATH) or not os.path.exists(CONFIG_PATH):
@@ -88,6 +89,14 @@ def _get_physical_audio_device():
 #TTS_OUTPUT_DEVICE, detected_device_name = _get_physical_audio_device()
 
 # --- 5. NEW: Text Normalization Function ---
+# Patterns are compiled once at import; normalization runs on every sentence spoken
+# Markdown emphasis and [bracketed system notes] are both plain deletions, so one
+# alternation strips them in a single scan; headings run after so "**# Title**" still clears
+_MARKUP_RE = re.compile(r'\[.*?\]|[*_]{1,3}')
+_HEADING_RE = re.compile(r'^\s*#+\s*', re.MULTILINE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?\n])\s+')
+
 def _normalize_text_for_speech(text: str) -> str:
     """
     Cleans and normalizes text to make it more suitable for TTS.
@@ -98,17 +107,19 @@ def _normalize_text_for_speech(text: str) -> str:
     if not text:
         return ""
 
-    # 1. Remove markdown emphasis (asterisks, underscores)
-    text = re.sub(r'(\*|_){1,3}', '', text)
+    # Most sentences are plain prose; cheap substring checks skip the regex scans
 
-    # 2. Remove markdown headings (e.g., #, ##)
-    text = re.sub(r'^\s*#+\s*', '', text, flags=re.MULTILINE)
+    # 1. Remove markdown emphasis (asterisks, underscores) and system-generated
+    #    metadata in square brackets (e.g., [System Note: ...]) in one pass
+    if '*' in text or '_' in text or '[' in text:
+        text = _MARKUP_RE.sub('', text)
 
-    # 3. Remove system-generated metadata in square brackets (e.g., [System Note: ...])
-    text = re.sub(r'\[.*?\]', '', text)
+    # 2. Remove markdown headings (e.g., #, ##)
+    if '#' in text:
+        text = _HEADING_RE.sub('', text)
 
-    # 4. Collapse multiple spaces and newlines into a single space
-    text = re.sub(r'\s+', ' ', text).strip()
+    # 3. Collapse multiple spaces and newlines into a single space
+    text = _WHITESPACE_RE.sub(' ', text).strip()
 
     return text
 
@@ -123,7 +134,7 @@ def process_stream_chunk(text_chunk: str):
     _stream_buffer += text_chunk
     
     # Regex to find sentence boundaries (., !, ?, or newline) followed by a space or end of string
-    sentences = re.split(r'(?<=[.!?\n])\s+', _stream_buffer)
+    sentences = _SENTENCE_BOUNDARY_RE.split(_stream_buffer)
     
     if len(sentences) > 1:
         # Speak all complete sentences
@@ -153,6 +164,27 @@ def speak(text: str):
     if normalized_text:
         tts_queue.put(normalized_text)
 
+def add_speaking_listener(callback):
+    """Register callback(speaking: bool), called from the TTS thread when speech starts/stops."""
+    _speaking_listeners.append(callback)
+
+def remove_speaking_listener(callback):
+    """Unregister a callback added with add_speaking_listener."""
+    try:
+        _speaking_listeners.remove(callback)
+    except ValueError:
+        pass
+
+def _set_speaking(speaking: bool):
+    """Update IS_SPEAKING and notify listeners."""
+    global IS_SPEAKING
+    IS_SPEAKING = speaking
+    for callback in list(_speaking_listeners):
+        try:
+            callback(speaking)
+        except Exception as e:
+            logger.warning(f"[TTS] Speaking listener failed: {e}")
+
 # --- 5. MODIFIED CORE TTS FUNCTION ---
 def _process_tts_queue():
     """
@@ -160,7 +192,6 @@ def _process_tts_queue():
     """
     accumulated_audio_chunks = []  # Accumulates audio across multiple utterances
     stream_start_time = None  # Track when streaming started
-    global IS_SPEAKING
     
     while not stop_event.is_set():
         try:
@@ -207,7 +238,7 @@ def _process_tts_queue():
                 stream_start_time = time.time()
             
             utterance_start = time.time()
-            IS_SPEAKING = True
+            _set_speaking(True)
 
             # Use physical device (Logitech) instead of default (VB-Cable)
             with sd.RawOutputStream(
@@ -233,7 +264,7 @@ def _process_tts_queue():
                     stream.write(chunk.audio_int16_bytes)
                     accumulated_audio_chunks.append(chunk.audio_int16_bytes)
 
-            IS_SPEAKING = False
+            _set_speaking(False)
             utterance_end = time.time()
             if False:
                 print(f"Finished streaming utterance. Time: {utterance_end - utterance_start:.2f}s")
@@ -1,33 +1,54 @@
 import sqlite3
 import os
-from pathlib import Path
+
+PROJECT_ROOT_STR = "c:/GitBash/Orion"
+
+# Columns deep_memory must have: (name, type/default DDL). All missing ones are added in one transaction.
+COLUMNS_TO_ADD = [
+    ("model_source", "TEXT DEFAULT 'gemini-3-pro-preview'"),
+]
 
 def migrate_schema():
-    PROJECT_ROOT = Path("c:/GitBash/Orion")
     persona = "default"
-    db_path = PROJECT_ROOT / 'databases' / persona / 'orion_database.sqlite'
+    db_path = os.path.join(PROJECT_ROOT_STR, 'databases', persona, 'orion_database.sqlite')
     
     print(f"Migrating schema for: {db_path}")
     
-    if not db_path.exists():
+    if not os.path.exists(db_path):
          print("DB File not found.")
          return
 
     try:
-        with sqlite3.connect(db_path) as conn:
+        # Autocommit mode: the preflight reads run outside any transaction and the only
+        # transaction is the explicit BEGIN IMMEDIATE ... COMMIT around the ALTERs
+        with sqlite3.connect(db_path, isolation_level=None) as conn:
             cursor = conn.cursor()
             
-            # Check if column exists first
-            cursor.execute("PRAGMA table_info(deep_memory)")
-            columns = [info[1] for info in cursor.fetchall()]
+            # Read-only preflight: nothing to migrate without the table, so don't take a write lock
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'deep_memory'")
+            if not cursor.fetchone():
+                print("Table 'deep_memory' not found. Nothing to migrate.")
+                return
+            
+            # Take the write lock up front so the check and the ALTER are one transaction
+            # (a concurrent run cannot add the column in between; re-runs stay a no-op)
+            cursor.execute("BEGIN IMMEDIATE")
+            
+            # Check which columns exist first (names only, one query for all of them)
+            cursor.execute("SELECT name FROM pragma_table_info('deep_memory')")
+            existing = {row[0] for row in cursor.fetchall()}
+            missing = [(name, ddl) for name, ddl in COLUMNS_TO_ADD if name not in existing]
             
-            if "model_source" in columns:
-                print("Column 'model_source' already exists. Skipping.")
+            if not missing:
+                cursor.execute("ROLLBACK")  # Nothing written: just release the write lock
+                print("All columns already exist. Skipping.")
                 return
 
-            print("Adding column 'model_source'...")
-            cursor.execute("ALTER TABLE deep_memory ADD COLUMN model_source TEXT DEFAULT 'gemini-3-pro-preview'")
-            conn.commit()
+            # Every ALTER runs inside the transaction opened above: one commit, one fsync
+            for name, ddl in missing:
+                print(f"Adding column '{name}'...")
+                cursor.execute(f"ALTER TABLE deep_memory ADD COLUMN {name} {ddl}")
+            cursor.execute("COMMIT")
             print("Migration successful.")
 
     except Exception as e:
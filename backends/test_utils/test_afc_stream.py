@@ -1,7 +1,6 @@
 import os
 import asyncio
-from google import genai
-from google.genai import types
+import functools
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,9 +12,46 @@ def test_tool():
 
 tools = [test_tool]
 
-client = genai.Client(vertexai=True, project=os.getenv("GOOGLE_CLOUD_PROJECT_ID"), location="global")
+@functools.lru_cache(maxsize=1)
+def get_client():
+    """Create the Vertex AI client on first use (importing this module stays cheap and offline)."""
+    from google import genai
+    return genai.Client(vertexai=True, project=os.getenv("GOOGLE_CLOUD_PROJECT_ID"), location="global")
 
-def run_stream_test(enable_afc: bool):
+async def stream_prompt(client, content: str, config, label: str):
+    """Stream one prompt, prefixing every line with `label` so concurrent streams stay readable."""
+    # Async client: chunks are pulled on the event loop, no sync-over-async thread hop
+    response_stream = await client.aio.models.generate_content_stream(
+        model="gemini-3-pro-preview",
+        contents=content,
+        config=config,
+    )
+
+    print(f"{label} --- Stream Start ---")
+    last_chunk = None
+    async for chunk in response_stream:
+        # Print what we receive
+        last_chunk = chunk
+        candidates = chunk.candidates
+        if candidates:
+            candidate_content = candidates[0].content
+            for part in (candidate_content.parts if candidate_content else None) or ():
+                # Each field read once per part
+                function_call = part.function_call
+                text = part.text
+                if function_call:
+                    print(f"{label} CHUNK: Function Call -> {function_call.name}")
+                if text:
+                    print(f"{label} CHUNK: Text -> {text.strip()}")
+        else:
+            print(f"{label} CHUNK: No candidates (Usage/Other) -> {chunk}")
+    print(f"{label} --- Stream End ---")
+    if last_chunk is not None:
+        print(f"{label} {last_chunk.automatic_function_calling_history}")
+
+async def run_stream_test(enable_afc: bool):
+    from google.genai import types
+    client = get_client()
     print(f"\n\n=== Testing with automatic_function_calling={enable_afc} ===")
 
     # We need to construct the config object carefully
@@ -26,31 +62,13 @@ def run_stream_test(enable_afc: bool):
     try:
 
         content_list = ["Call the test_tool function.", "Say 1 - 5 slowly."]
-        # Test the stream
-        for content in content_list:
-            response_stream = client.models.generate_content_stream(
-                model="gemini-3-pro-preview",
-                contents=content,
-                config=types.GenerateContentConfig(
-                    tools=tools
-                ),
-            )
-
-            print("--- Stream Start ---")
-            last_chunk = None
-            for chunk in response_stream:
-                # Print what we receive
-                last_chunk = chunk
-                if chunk.candidates:
-                    for part in chunk.candidates[0].content.parts:
-                        if part.function_call:
-                            print(f"CHUNK: Function Call -> {part.function_call.name}")
-                        if part.text:
-                            print(f"CHUNK: Text -> {part.text.strip()}")
-                else:
-                    print(f"CHUNK: No candidates (Usage/Other) -> {chunk}")
-            print("--- Stream End ---")
-            print(last_chunk.automatic_function_calling_history)
+        # Same tools for every prompt: build (and validate) the config once
+        config = types.GenerateContentConfig(tools=tools)
+        # Test the streams concurrently: total time is the slowest prompt, not the sum
+        await asyncio.gather(*(
+            stream_prompt(client, content, config, f"[{index}]")
+            for index, content in enumerate(content_list, 1)
+        ))
 
     except Exception as e:
         print(f"ERROR: {e}")
@@ -58,7 +76,7 @@ def run_stream_test(enable_afc: bool):
 if __name__ == "__main__":
     print("Running reproduction tests...")
     # Test 1: AFC Enabled (Default behavior)
-    run_stream_test(enable_afc=True)
+    asyncio.run(run_stream_test(enable_afc=True))
     
     # Test 2: AFC Disabled
-    #run_stream_test(enable_afc=False)
+    #asyncio.run(run_stream_test(enable_afc=False))
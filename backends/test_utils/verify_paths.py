@@ -1,8 +1,9 @@
 import sys
 from pathlib import Path
 
-# Add project root to sys.path
-sys.path.append("c:\\GitBash\\Orion")
+# Add project root to sys.path (kept as a string; no Path round-trip needed)
+PROJECT_ROOT_STR = "c:\\GitBash\\Orion"
+sys.path.append(PROJECT_ROOT_STR)
 
 from main_utils import config, main_functions
 
@@ -30,12 +31,15 @@ def verify():
     # Check 4: get_db_paths resolution (simulating config.PERSONA='default')
     paths = main_functions.get_db_paths("default")
     print("\n--- DB Paths Resolution ---")
+    # One print for the whole report, same order as before
+    lines = []
     for key, val in paths.items():
-        print(f"{key}: {val}")
+        lines.append(f"{key}: {val}")
         if isinstance(val, str):
-             print(f"  -> [PASS] {key} returned as string (Compatibility Mode)")
+            lines.append(f"  -> [PASS] {key} returned as string (Compatibility Mode)")
         else:
-             print(f"  -> [WARN] {key} is {type(val)} (Expected str)")
+            lines.append(f"  -> [WARN] {key} is {type(val)} (Expected str)")
+    print("\n".join(lines))
 
     print("\n--- System Utils Import Check ---")
     try:
@@ -20,7 +20,7 @@ class DebugMonitor:
         # Video frame tracking
         self.current_frame = None
         self.frame_count = 0
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.monotonic()
         self.fps = 0.0
         
         # Audio tracking
@@ -28,13 +28,13 @@ class DebugMonitor:
         self.audio_peak = 0
         self.audio_count = 0
         self.audio_drops = 0  # ← ADD THIS
-        self.last_audio_time = time.time()
+        self.last_audio_time = time.monotonic()
         self.audio_rate = 0.0  # Chunks per second
         
         # Token Usage Tracking (Estimated)
         self.token_counts = {"audio": 0, "video": 0}
         self.token_rates = {"audio": 0.0, "video": 0.0}
-        self.last_token_update = time.time()
+        self.last_token_update = time.monotonic()
         
         # Display window
         self.window_name = "AI Debug Monitor"
@@ -68,7 +68,7 @@ class DebugMonitor:
             
             # Update stats
             self.frame_count += 1
-            current_time = time.time()
+            current_time = time.monotonic()
             elapsed = current_time - self.last_frame_time
             if elapsed >= 1.0:  # Update FPS every second
                 self.fps = self.frame_count / elapsed
@@ -97,7 +97,7 @@ class DebugMonitor:
             
             # Update stats
             self.audio_count += 1
-            current_time = time.time()
+            current_time = time.monotonic()
             elapsed = current_time - self.last_audio_time
             if elapsed >= 1.0:  # Update rate every second
                 self.audio_rate = self.audio_count / elapsed
@@ -123,7 +123,7 @@ class DebugMonitor:
 
     def _update_token_rates(self):
         """Update token usage rates"""
-        current_time = time.time()
+        current_time = time.monotonic()
         elapsed = current_time - self.last_token_update
         
         if elapsed >= 1.0:
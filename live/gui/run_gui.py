@@ -2,7 +2,6 @@
 GUI Application Entry Point for Orion Live
 """
 import sys
-import asyncio
 import threading
 from pathlib import Path
 
@@ -14,13 +13,13 @@ if str(PROJECT_ROOT) not in sys.path:
 from PyQt6.QtWidgets import QApplication
 
 from live.gui.main_window import MainWindow
-from live.live import LiveSessionOrchestrator
+from live.live import LiveSessionOrchestrator, run_event_loop
 
 def run_backend_thread(orchestrator):
     """Run backend in separate thread with its own event loop"""
     print("Backend thread starting...")
     try:
-        asyncio.run(orchestrator.run())
+        run_event_loop(orchestrator.run())
     except Exception as e:
         print(f"Backend error: {e}")
         import traceback
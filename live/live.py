@@ -12,6 +12,7 @@ import os
 import sys
 import time
 import argparse
+import random
 import signal
 import threading
 import traceback
@@ -21,7 +22,14 @@ from typing import Optional
 import dotenv
 dotenv.load_dotenv()
 
-if sys.version_info < (3, 11, 0):
+# Optional libuv-backed event loop (not available on Windows, falls back to asyncio)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Backport TaskGroup/ExceptionGroup only when the running asyncio lacks them (< 3.11)
+if not hasattr(asyncio, "TaskGroup"):
     import taskgroup, exceptiongroup
     asyncio.TaskGroup = taskgroup.TaskGroup
     asyncio.ExceptionGroup = exceptiongroup.ExceptionGroup
@@ -41,7 +49,7 @@ if config.VERTEX:
     import google.auth.transport.requests
     import google.auth.transport.grpc
 
-from live.live_ui import conversation, system_log, debug_log, print_separator
+from live.live_ui import conversation, system_log, debug_log, print_separator, track_terminal_width
 from live.window_selection_ui import select_window_for_capture
 
 # Import new modules
@@ -119,6 +127,9 @@ BASE_SYSTEM_INSTRUCTION = """
         4. Do not let the session stay silent for long periods if visual things are happening.
         5. **PRIORITIZE NOW**: Your context window contains history, but you must prioritize the *immediate* audio and video frames you are receiving. Do not comment on events from 10+ seconds ago unless they directly cause what is happening now. If you are lagging, skip the old topic and sync with the present."""
 
+# Build the system instruction Content once so reconnects reuse the validated object
+SYSTEM_INSTRUCTION_CONTENT = types.Content(parts=[types.Part(text=BASE_SYSTEM_INSTRUCTION)])
+
 client = None
 if config.VERTEX:
     client = genai.Client(vertexai=True, project=os.getenv("GOOGLE_CLOUD_PROJECT_ID"), location="global")
@@ -154,12 +165,14 @@ class LiveSessionOrchestrator:
 
         # [NEW] Async loop reference for thread-safe GUI interaction
         self.loop = None
+        self._shutdown_event = None  # Created in run() so it binds to the session loop
         
         self._setup_signal_handlers()
 
     def _initialize_pipelines(self):
         """Initialize pipelines in the current event loop."""
         # Re-initialize pipelines so their queues bind to the current loop
+        self.connection_manager.bind_to_current_loop()
         self.video_pipeline = VideoPipeline(self.connection_manager, mode=self.video_mode, signals=self.signals)
         self.audio_pipeline = AudioPipeline(self.connection_manager, signals=self.signals)
         self.input_pipeline = InputPipeline(self.connection_manager)
@@ -170,6 +183,7 @@ class LiveSessionOrchestrator:
         # [NEW] Link pipelines (moved from __init__)
         self.response_pipeline.video_pipeline = self.video_pipeline
         self.response_pipeline.session_id = self.session_id
+        self.input_pipeline.on_activity = self.response_pipeline.mark_activity
         
         # [NEW] Start TTS thread
         if orion_tts:
@@ -187,7 +201,7 @@ class LiveSessionOrchestrator:
             return
 
         if self.loop and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self.input_pipeline.user_input_queue.put_nowait, text)
+            self.loop.call_soon_threadsafe(self.input_pipeline.submit, text)
             system_log.info(f"User message submitted from GUI: {text}", category="INPUT")
         else:
             system_log.warning("Cannot submit message: Loop not running", category="INPUT")
@@ -238,16 +252,23 @@ class LiveSessionOrchestrator:
         """Thread-safe stop request."""
         system_log.info("Stop session requested from GUI", category="SESSION")
         self.shutdown_requested = True
+        if self._shutdown_event is not None and self.loop and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._shutdown_event.set)
         
         # [NEW] Check if pipeline exists and unblock
         if self.input_pipeline and self.loop and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self.input_pipeline.user_input_queue.put_nowait, "q")
+            self.loop.call_soon_threadsafe(self.input_pipeline.submit, "q")
 
     def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown."""
+        """
+        Setup fallback signal handlers for graceful shutdown.
+        On POSIX, run() replaces these with loop-level handlers when it owns the main thread.
+        """
         def signal_handler(signum, frame):
             print(f"\n[SESSION] Received signal {signum}. Initiating graceful shutdown...")
             self.shutdown_requested = True
+            if self._shutdown_event is not None and self.loop and self.loop.is_running():
+                self.loop.call_soon_threadsafe(self._shutdown_event.set)
         
         if sys.platform != "win32":
             signal.signal(signal.SIGINT, signal_handler)
@@ -255,6 +276,34 @@ class LiveSessionOrchestrator:
         else:
             signal.signal(signal.SIGINT, signal_handler)
 
+    def _install_loop_signal_handlers(self) -> bool:
+        """Route SIGINT/SIGTERM straight into the event loop (POSIX main thread only)."""
+        if sys.platform == "win32":
+            return False
+        try:
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                self.loop.add_signal_handler(signum, self._on_shutdown_signal, signum)
+        except (ValueError, RuntimeError, NotImplementedError):
+            # Not in the main thread (e.g. GUI backend thread); keep signal.signal fallback
+            return False
+        return True
+
+    def _remove_loop_signal_handlers(self):
+        """Remove loop-level signal handlers installed by run()."""
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            self.loop.remove_signal_handler(signum)
+
+    def _on_shutdown_signal(self, signum):
+        """Loop-level signal callback: flag shutdown and wake the session immediately."""
+        print(f"\n[SESSION] Received signal {signum}. Initiating graceful shutdown...")
+        self.shutdown_requested = True
+        self._shutdown_event.set()
+
+    async def _shutdown_watch(self, send_text_task):
+        """Cancel the session's main task as soon as shutdown is signalled."""
+        await self._shutdown_event.wait()
+        send_text_task.cancel()
+
     async def _graceful_shutdown(self):
         """Perform graceful shutdown."""
         system_log.info("Performing graceful shutdown...", category="SESSION")
@@ -266,11 +315,20 @@ class LiveSessionOrchestrator:
         if total_duration > 0:
             system_log.info(f"Total session duration: {self._format_session_duration()}", category="SESSION")
         
+        # Make sure the last resumption handle actually reached the disk: let pending
+        # background saves finish first, or sync() runs before they are written
+        if self.response_pipeline:
+            await self.response_pipeline.wait_for_saves()
+        await asyncio.to_thread(self.session_state.sync)
+        
         if self.session_state.resumption_handle:
             system_log.info(f"Session state preserved. Resumption handle available for next run.", category="SESSION")
         else:
             system_log.info("No resumption handle available. Next run will start fresh session.", category="SESSION")
             
+        # Release the persistent screen grabber (joins the video worker, so keep it off the loop)
+        await asyncio.to_thread(self.video_pipeline.close)
+        
         # Stop debug monitor
         if self.video_pipeline.debug_monitor:
             self.video_pipeline.debug_monitor.stop()
@@ -280,10 +338,8 @@ class LiveSessionOrchestrator:
 
     def _format_session_duration(self) -> str:
         """Format session duration as human-readable string."""
-        total_seconds = self._get_session_duration_seconds()
-        hours = int(total_seconds // 3600)
-        minutes = int((total_seconds % 3600) // 60)
-        seconds = int(total_seconds % 60)
+        minutes, seconds = divmod(int(self._get_session_duration_seconds()), 60)
+        hours, minutes = divmod(minutes, 60)
         
         if hours > 0:
             return f"{hours}h {minutes}m {seconds}s"
@@ -296,19 +352,19 @@ class LiveSessionOrchestrator:
         """Get total session duration in seconds."""
         if self.session_start_time is None:
             return self.total_session_duration
-        current_duration = time.time() - self.session_start_time
+        current_duration = time.monotonic() - self.session_start_time
         return current_duration + self.total_session_duration
     
     def _start_session_timer(self):
         """Start or resume session timer."""
         if self.session_start_time is None:
-            self.session_start_time = time.time()
+            self.session_start_time = time.monotonic()
             system_log.info(f"Session timer started", category="SESSION")
     
     def _pause_session_timer(self):
         """Pause session timer."""
         if self.session_start_time is not None:
-            elapsed = time.time() - self.session_start_time
+            elapsed = time.monotonic() - self.session_start_time
             self.total_session_duration += elapsed
             self.session_start_time = None
             system_log.info(f"Session timer paused. Total duration so far: {self._format_session_duration()}", category="SESSION")
@@ -320,7 +376,7 @@ class LiveSessionOrchestrator:
             "context_window_compression": types.ContextWindowCompressionConfig(
                 sliding_window=types.SlidingWindow()
             ),
-            "system_instruction": BASE_SYSTEM_INSTRUCTION,
+            "system_instruction": SYSTEM_INSTRUCTION_CONTENT,
             # Aggressive Turn Detection for continuous audio environments
             "realtime_input_config": {
                 "automatic_activity_detection": {
@@ -374,6 +430,7 @@ class LiveSessionOrchestrator:
         tg.create_task(self.response_pipeline.handle_responses())
         tg.create_task(self.response_pipeline.passive_observer_task())
         tg.create_task(self.session_duration_task())
+        tg.create_task(self._shutdown_watch(send_text_task))
         
         return send_text_task
 
@@ -383,6 +440,8 @@ class LiveSessionOrchestrator:
 
         # [NEW] Capture the running loop for thread-safe GUI interaction
         self.loop = asyncio.get_running_loop()
+        self._shutdown_event = asyncio.Event()
+        loop_signals_installed = self._install_loop_signal_handlers()
 
         # [NEW] Initialize pipelines here
         self._initialize_pipelines()
@@ -420,7 +479,7 @@ class LiveSessionOrchestrator:
                             self.signals.connection_status_changed.emit(True, "Connected")
 
                         # Log queue status
-                        queue_size = self.input_pipeline.user_input_queue.qsize()
+                        queue_size = len(self.input_pipeline.pending_input)
                         if queue_size > 0:
                             system_log.info(f"Reconnected with {queue_size} pending user message(s) in queue", category="INPUT")
                         
@@ -505,7 +564,8 @@ class LiveSessionOrchestrator:
                     self.connection_manager.goaway_received = False
                     self.reconnection_pending = False
                 elif self.reconnect_count < self.max_reconnect_attempts:
-                    wait_time = min(2 ** self.reconnect_count, 10)
+                    # Exponential backoff with jitter so flaky networks don't retry in lockstep
+                    wait_time = round(min(2 ** self.reconnect_count, 10) * (0.5 + random.random()), 1)
                     system_log.info(f"Reconnecting in {wait_time} seconds... (attempt {self.reconnect_count + 1}/{self.max_reconnect_attempts})", category="SESSION")
                     
                     # [NEW] Emit Reconnecting Signal
@@ -518,10 +578,12 @@ class LiveSessionOrchestrator:
                     break
         
         finally:
+            if loop_signals_installed:
+                self._remove_loop_signal_handlers()
             
-            # [NEW] Stop TTS thread
+            # [NEW] Stop TTS thread (joins with a timeout, so run it off the loop)
             if orion_tts:
-                orion_tts.stop_tts_thread()
+                await asyncio.to_thread(orion_tts.stop_tts_thread)
                 system_log.info("TTS thread stopped", category="AUDIO")
 
             # [NEW] Emit Disconnected Signal
@@ -532,6 +594,14 @@ class LiveSessionOrchestrator:
         
         system_log.info("Session ended", category="SESSION")
 
+
+def run_event_loop(coro):
+    """Run a coroutine to completion on uvloop when installed, else the default asyncio loop."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -542,6 +612,7 @@ if __name__ == "__main__":
         choices=["camera", "screen", "window", "none"],  # Add "window"
     )
     args = parser.parse_args()
+    track_terminal_width()
     main = LiveSessionOrchestrator(video_mode=args.mode)
 
     # If window mode, show window selection UI
@@ -550,6 +621,6 @@ if __name__ == "__main__":
 
     orion_tts.start_tts_thread()
     print("--- TTS Module is Activated. ---")
-    asyncio.run(main.run())
+    run_event_loop(main.run())
     orion_tts.stop_tts_thread()
     print("--- TTS Module is Deactivated. ---")
\ No newline at end of file
@@ -6,15 +6,51 @@ Provides three visual output sections:
 - Debug: Detailed technical output (VIDEO_DEBUG only)
 """
 
+import asyncio
 import os
+import signal
 import time
 from rich.console import Console
 from rich.text import Text
 from rich.panel import Panel
 from rich.style import Style
 
-# Initialize console
-console = Console()
+# Initialize console. Every styled line is built as a Text, so Rich's repr highlighter
+# (a regex pass over each plain-string print) is turned off
+console = Console(highlight=False)
+
+# Terminal width cache, refreshed on SIGWINCH once track_terminal_width() has been
+# called (console.width queries the terminal size on every access). Until then, and
+# without SIGWINCH (Windows), the width is read live.
+_console_width = None
+
+
+def _refresh_console_width():
+    global _console_width
+    _console_width = console.width
+
+
+def track_terminal_width():
+    """
+    Cache the terminal width and refresh it on resize (CLI entry point, main thread).
+    Chains to any SIGWINCH handler installed before it.
+    """
+    if not hasattr(signal, "SIGWINCH"):
+        return
+    previous = signal.getsignal(signal.SIGWINCH)
+    
+    def on_resize(signum, frame):
+        _refresh_console_width()
+        if callable(previous):
+            previous(signum, frame)
+    
+    signal.signal(signal.SIGWINCH, on_resize)
+    _refresh_console_width()
+
+
+def get_console_width() -> int:
+    """Current terminal width, from the resize-driven cache when available."""
+    return _console_width if _console_width is not None else console.width
 
 # Check if debug mode is enabled
 VIDEO_DEBUG = os.getenv("VIDEO_DEBUG", "false").lower() == "true"
@@ -41,6 +77,11 @@ COLORS = {
     "separator": "#6B7280",  # Dim Gray
 }
 
+# AI streaming: chunks arriving within this window are written together,
+# unless this many characters are already waiting
+AI_STREAM_FLUSH_INTERVAL = 0.016  # ~one frame at 60 Hz
+AI_STREAM_FLUSH_CHARS = 128
+
 # Emoji mapping for categories
 CATEGORY_ICONS = {
     "SESSION": "🟢",
@@ -54,7 +95,7 @@ CATEGORY_ICONS = {
 
 def print_separator(title: str):
     """Print a section separator with title."""
-    separator = "━" * (console.width - len(title) - 4)
+    separator = "━" * (get_console_width() - len(title) - 4)
     text = Text()
     text.append("━━ ", style=COLORS["separator"])
     text.append(title, style="bold " + COLORS["separator"])
@@ -82,16 +123,26 @@ class ConversationHandler:
     
     def __init__(self):
         self.ai_buffer = []  # Buffer for streaming AI responses
+        self._ai_pending = []  # Chunks received but not yet written
+        self._ai_pending_chars = 0
+        self._ai_last_write = 0.0
+        self._ai_flush_handle = None  # Timer that writes pending chunks if no new chunk arrives
         self.section_printed = False
+        # Speaker prefixes never change, so they are built once
+        self._user_prefix = Text.assemble(("You", f"bold {COLORS['user']}"), (" > ", COLORS['user']))
+        self._ai_prefix = Text.assemble(("Orion", f"bold {COLORS['ai']}"), (" > ", COLORS['ai']))
     
     def _print_conversation_separator(self):
         """Print conversation separator line."""
         console.print()  # Blank line
-        separator = "─" * console.width
+        separator = "─" * get_console_width()
         console.print(separator, style=COLORS["separator"])
     
     def user_input(self, text: str):
         """Display user input."""
+        # AI text that arrived earlier must reach the terminal before the user's line
+        self._write_pending_ai()
+        
         # Print separator before conversation
         if self.section_printed:  # Not the first time
             self._print_conversation_separator()
@@ -99,30 +150,66 @@ class ConversationHandler:
             console.print()  # Just blank line for first time
             self.section_printed = True
         
-        user_text = Text()
-        user_text.append("You", style=f"bold {COLORS['user']}")
-        user_text.append(" > ", style=COLORS['user'])
+        user_text = self._user_prefix.copy()
         user_text.append(text, style=COLORS['user'])  # Apply color to text
         console.print(user_text)
         console.print()  # Blank line after user input
     
     def stream_ai(self, text: str):
-        """Stream AI response text (no newline)."""
-        # If this is the first chunk, print AI prefix
-        if not self.ai_buffer:
-            ai_prefix = Text()
-            ai_prefix.append("Orion", style=f"bold {COLORS['ai']}")
-            ai_prefix.append(" > ", style=COLORS['ai'])
-            console.print(ai_prefix, end="")
-        
-        # Print the chunk with AI color styling
-        styled_text = Text(text, style=COLORS['ai'])
-        console.print(styled_text, end="")
+        """
+        Stream AI response text (no newline).
+        Chunks arriving in a quick burst are coalesced into one terminal write;
+        anything still pending is written within AI_STREAM_FLUSH_INTERVAL by a
+        timer on the running loop, so text never waits for the next chunk.
+        """
+        first = not self.ai_buffer
         self.ai_buffer.append(text)
+        self._ai_pending.append(text)
+        self._ai_pending_chars += len(text)
+        
+        now = time.monotonic()
+        if (first or self._ai_pending_chars >= AI_STREAM_FLUSH_CHARS
+                or now - self._ai_last_write >= AI_STREAM_FLUSH_INTERVAL):
+            # The first chunk goes out at once, together with the AI prefix
+            self._cancel_ai_flush()
+            self._write_ai(with_prefix=first)
+            self._ai_last_write = now
+        elif self._ai_flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No loop to schedule the residual flush on: write now
+                self._write_ai()
+                self._ai_last_write = now
+                return
+            delay = AI_STREAM_FLUSH_INTERVAL - (now - self._ai_last_write)
+            self._ai_flush_handle = loop.call_later(delay, self._write_pending_ai)
+    
+    def _cancel_ai_flush(self):
+        """Cancel the scheduled residual flush, if any."""
+        if self._ai_flush_handle is not None:
+            self._ai_flush_handle.cancel()
+            self._ai_flush_handle = None
+    
+    def _write_pending_ai(self):
+        """Write chunks still waiting for the coalescing window (timer callback)."""
+        self._cancel_ai_flush()
+        if self._ai_pending:
+            self._write_ai()
+            self._ai_last_write = time.monotonic()
+    
+    def _write_ai(self, with_prefix: bool = False):
+        """Print the pending AI chunks as one styled Text."""
+        line = self._ai_prefix.copy() if with_prefix else Text()
+        line.append("".join(self._ai_pending), style=COLORS['ai'])
+        self._ai_pending.clear()
+        self._ai_pending_chars = 0
+        console.print(line, end="")
     
     def flush_ai(self):
         """Complete AI message with newline."""
         if self.ai_buffer:
+            self._write_pending_ai()
             console.print()  # Newline to complete message
             console.print()  # Blank line after AI response
             self.ai_buffer = []
@@ -133,7 +220,8 @@ class SystemLogHandler:
     
     def __init__(self):
         self.section_printed = False
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._styles = {}  # category -> (prefix, color, error variant or None), built on first use
     
     def _ensure_section_header(self):
         """Print section header once."""
@@ -151,22 +239,38 @@ class SystemLogHandler:
             category: Category (SESSION, VIDEO, CONNECTION, INPUT, PASSIVE, TEXT)
             duration: Optional duration in seconds (for relative time display)
         """
-        self._ensure_section_header()
+        self._render(message, category, duration)
+    
+    @staticmethod
+    def _category_style(category: str):
+        """
+        Build (prefix Text, color, error_style) for a category. error_style is the red
+        (prefix, color) pair used for CONNECTION lines mentioning an error, else None.
+        """
+        label = category.upper()
+        icon = CATEGORY_ICONS.get(label, "ℹ️")
         
-        # Get emoji icon
-        icon = CATEGORY_ICONS.get(category.upper(), "ℹ️")
+        def styled(color):
+            return Text.assemble((f"{icon} ", color), (label.ljust(12), f"bold {color}")), color
         
-        # Get color for category
         color_key = category.lower()
-        if color_key == "connection" and "error" in message.lower():
-            color = COLORS["connection_error"]
-        else:
-            color = COLORS.get(color_key, COLORS["session"])
+        error_style = styled(COLORS["connection_error"]) if color_key == "connection" else None
+        return (*styled(COLORS.get(color_key, COLORS["session"])), error_style)
+    
+    def _render(self, message: str, category: str, duration: float):
+        """Format and print one log line."""
+        self._ensure_section_header()
+        
+        # One lookup for icon, color and padded label
+        style = self._styles.get(category)
+        if style is None:
+            style = self._styles[category] = self._category_style(category)
+        prefix, color, error_style = style
+        if error_style is not None and "error" in message.lower():
+            prefix, color = error_style
         
-        # Build log line
-        log_line = Text()
-        log_line.append(f"{icon} ", style=color)
-        log_line.append(category.upper().ljust(12), style=f"bold {color}")
+        # Build log line from the cached prefix
+        log_line = prefix.copy()
         log_line.append(message, style=color)
         
         # Add relative time if provided
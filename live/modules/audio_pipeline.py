@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import time
 import numpy as np
 import sounddevice as sd
@@ -27,30 +28,48 @@ CHANNELS = 1
 SEND_SAMPLE_RATE = 16000
 CHUNK_SIZE = 1024
 AI_INPUT_DEVICE = 6  # or whatever ID has "Aux" or "Output" in VoiceMeeter devices
+AUDIO_MIME_TYPE = sys.intern(f"audio/pcm;rate={SEND_SAMPLE_RATE}")
+
+# Blob factory with the constant MIME type pre-bound
+make_audio_blob = functools.partial(types.Blob, mime_type=AUDIO_MIME_TYPE)
+
 
 class AudioPipeline:
     def __init__(self, connection_manager, signals=None):
         self.connection_manager = connection_manager
         self.audio_out_queue = asyncio.Queue(maxsize=60)
         self.debug_monitor = get_monitor()
-        self.last_interaction_time = time.time()
+        self.last_interaction_time = time.monotonic()
         self.signals = signals
         
         # Stats
         self.audio_count = 0
         self.audio_drops = 0
-        self.last_stats_time = time.time()
+        self.last_stats_time = time.monotonic()
 
     async def send_realtime_audio(self):
+        # Hot-loop locals; the bound send is re-resolved only when the session changes
+        queue_get = self.audio_out_queue.get
+        connection_manager = self.connection_manager
+        monotonic = time.monotonic
+        session = None
+        send = None
+        
         while True:
-            audio = await self.audio_out_queue.get()
+            data = await queue_get()
             try:
-                await self.connection_manager.session.send_realtime_input(audio=types.Blob(data=audio.get("data"), mime_type=audio.get("mime_type")))
+                current_session = connection_manager.session
+                if current_session is not session:
+                    session = current_session
+                    send = session.send_realtime_input if session is not None else None
+                if send is None:
+                    raise RuntimeError("no active session")
+                await send(audio=make_audio_blob(data=data))
                 
                 # Track stats
                 self.audio_count += 1
                 
-                current_time = time.time()
+                current_time = monotonic()
                 if current_time - self.last_stats_time >= 1.0:
                     rate = self.audio_count / (current_time - self.last_stats_time)
                     self.audio_count = 0
@@ -65,13 +84,13 @@ class AudioPipeline:
 
                 # Feed to debug monitor
                 if self.debug_monitor:
-                    self.debug_monitor.update_audio_level(audio.get("data"))
+                    self.debug_monitor.update_audio_level(data)
                     
                     # Calculate estimated tokens (32 tokens/sec)
                     # len(data) is bytes (int16 = 2 bytes). 
                     # Duration = (len / 2) / 16000. Tokens = Duration * 32.
                     # Simplifies to len(data) / 1000
-                    chunk_tokens = len(audio.get("data")) / 1000.0
+                    chunk_tokens = len(data) / 1000.0
                     self.debug_monitor.report_audio_tokens(chunk_tokens)
             except Exception as e:
                 self.audio_drops += 1
@@ -102,19 +121,27 @@ class AudioPipeline:
                 system_log.info(f"Retrying in {wait_time} seconds...", category="AUDIO")
                 await asyncio.sleep(wait_time)
         
-        # Create a queue for audio blocks
+        # Create a queue for (pcm_bytes, peak) blocks
         q = asyncio.Queue()
+        loop = asyncio.get_running_loop()
         
         def callback(indata, frames, time_info, status):
-            """Callback for sounddevice input stream."""
+            """Callback for sounddevice input stream (runs on the PortAudio thread)."""
             if status:
                 system_log.info(f"Audio status: {status}", category="AUDIO")
-            # Make a copy of the data to ensure it's safe to pass to another thread/loop
-            q.put_nowait(indata.copy())
+            # indata is PortAudio's raw buffer: peak via a NumPy view over it, and bytes()
+            # is the only copy, taken while the buffer is still valid.
+            # max/min reductions instead of np.abs(): no temporary array, no int16 overflow at -32768
+            samples = np.frombuffer(indata, dtype=np.int16)
+            peak = max(int(samples.max()), -int(samples.min()))
+            try:
+                loop.call_soon_threadsafe(q.put_nowait, (bytes(indata), peak))
+            except RuntimeError:
+                pass  # Loop closed while the stream was shutting down
 
         try:
             # Open the stream
-            with sd.InputStream(samplerate=SEND_SAMPLE_RATE,
+            with sd.RawInputStream(samplerate=SEND_SAMPLE_RATE,
                                 channels=CHANNELS,
                                 dtype='int16',
                                 callback=callback,
@@ -123,34 +150,34 @@ class AudioPipeline:
                 
                 system_log.info("Audio stream started", category="AUDIO")
                 
+                # Hot-loop locals
+                q_get = q.get
+                out_put = self.audio_out_queue.put
+                signals = self.signals
+                monotonic = time.monotonic
+                
                 while True:
                     # Get audio data from the queue
-                    indata = await q.get()
+                    data, peak = await q_get()
                     
                     # Check if AI is speaking (to avoid feedback loop if not using separate channels)
                     if orion_tts.IS_SPEAKING:
                         # Optional: mute system audio capture while AI is speaking to prevent echo
-                        # self.last_interaction_time = time.time() 
+                        # self.last_interaction_time = time.monotonic() 
                         #continue
                         pass
 
-                    # Simple VAD to keep session alive
-                    # indata is numpy array of int16
-                    peak = np.max(np.abs(indata))
+                    # Simple VAD to keep session alive (peak computed in the callback)
                     if peak > 500:
-                        self.last_interaction_time = time.time()
-                    
-                    # Convert to bytes
-                    data = indata.tobytes()
+                        self.last_interaction_time = monotonic()
                     
-                    # [NEW] Calculate and emit audio peak for visualization
-                    if self.signals:
-                        # indata is int16 numpy array
-                        peak = np.max(np.abs(indata))
-                        normalized_peak = float(peak) / 32768.0
-                        self.signals.audio_level_updated.emit(normalized_peak)
+                    # [NEW] Emit audio peak for visualization
+                    if signals:
+                        normalized_peak = peak / 32768.0
+                        signals.audio_level_updated.emit(normalized_peak)
                     
-                    await self.audio_out_queue.put({"data": data, "mime_type": "audio/pcm;rate=16000"})
+                    # Raw PCM bytes; the MIME type is constant and added at send time
+                    await out_put(data)
                     
         except Exception as e:
             system_log.info(f"Error in listen_audio: {e}", category="AUDIO")
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import re
 from pathlib import Path
 
 # Import system_log from live_ui
@@ -15,6 +17,20 @@ from live.live_ui import system_log
 # Check if debug mode is enabled
 VIDEO_DEBUG = os.getenv("VIDEO_DEBUG", "false").lower() == "true"
 
+# Error message patterns that indicate a dead connection (case-insensitive)
+DEAD_CONNECTION_PATTERN = re.compile(
+    r"deadline expired"
+    r"|connection closed"
+    r"|connection reset"
+    r"|connection aborted"
+    r"|broken pipe"
+    r"|1011"  # WebSocket close code for internal error
+    r"|websocket"
+    r"|session expired"
+    r"|invalid session",
+    re.IGNORECASE,
+)
+
 class GoAwayReconnection(Exception):
     """Exception raised when GoAway is received to trigger reconnection."""
     pass
@@ -23,12 +39,78 @@ class ConnectionManager:
     """Manages connection health and error handling."""
     
     def __init__(self):
-        self.connection_alive = False
-        self.connection_error_count = 0
+        self._connection_alive = False
+        self._connection_error_count = 0
         self.max_connection_errors = 3
-        self.goaway_received = False
-        self.session = None  # Reference to the active session
+        self._goaway_received = False
+        self._session = None  # Reference to the active session, cleared when its context exits
+        # Mirrors `healthy`, so loops can wait on it instead of polling. Rebuilt by
+        # bind_to_current_loop() because asyncio events belong to one event loop
+        self.session_ready = asyncio.Event()
+        # Cached result of the health check, recomputed whenever one of its inputs
+        # changes so the per-frame/per-chunk check is a single attribute read
+        self.healthy = False
+    
+    def _update_health(self):
+        """Recompute the cached health flag from the connection state."""
+        self.healthy = (
+            self._connection_alive
+            and self._session is not None
+            and not self._goaway_received
+            and self._connection_error_count < self.max_connection_errors
+        )
+        if self.healthy:
+            self.session_ready.set()
+        else:
+            self.session_ready.clear()
     
+    def bind_to_current_loop(self):
+        """Recreate loop-bound primitives for the running loop (the GUI restarts sessions on a new loop)."""
+        self.session_ready = asyncio.Event()
+        if self.healthy:
+            self.session_ready.set()
+    
+    async def wait_until_healthy(self):
+        """Sleep until the connection is healthy (no polling: session_ready mirrors `healthy`)."""
+        await self.session_ready.wait()
+    
+    @property
+    def connection_alive(self) -> bool:
+        return self._connection_alive
+
+    @connection_alive.setter
+    def connection_alive(self, value: bool):
+        self._connection_alive = value
+        self._update_health()
+
+    @property
+    def goaway_received(self) -> bool:
+        return self._goaway_received
+
+    @goaway_received.setter
+    def goaway_received(self, value: bool):
+        self._goaway_received = value
+        self._update_health()
+
+    @property
+    def connection_error_count(self) -> int:
+        return self._connection_error_count
+
+    @connection_error_count.setter
+    def connection_error_count(self, value: int):
+        self._connection_error_count = value
+        self._update_health()
+
+    @property
+    def session(self):
+        """The active session, or None between connections."""
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+        self._update_health()
+
     def set_session(self, session):
         """Set the active session."""
         self.session = session
@@ -37,16 +119,9 @@ class ConnectionManager:
         """
         Check if the connection is healthy and ready to accept input.
         Returns False if connection is dead, None, or too many errors occurred.
+        Hot loops can read the cached `healthy` attribute directly.
         """
-        if not self.connection_alive:
-            return False
-        if self.session is None:
-            return False
-        if self.goaway_received:
-            return False
-        if self.connection_error_count >= self.max_connection_errors:
-            return False
-        return True
+        return self.healthy
     
     def mark_dead(self, reason: str = "Unknown"):
         """Mark connection as dead and log the reason."""
@@ -67,27 +142,13 @@ class ConnectionManager:
         Handle connection errors and determine if connection should be marked as dead.
         Returns True if connection should be considered dead, False otherwise.
         """
-        error_str = str(error).lower()
         error_type = type(error).__name__
         
-        # Check for specific error patterns that indicate dead connection
-        dead_connection_indicators = [
-            "deadline expired",
-            "connection closed",
-            "connection reset",
-            "connection aborted",
-            "broken pipe",
-            "1011",  # WebSocket close code for internal error
-            "websocket",
-            "session expired",
-            "invalid session",
-        ]
-        
         # Increment error counter
         self.connection_error_count += 1
         
         # Check if error indicates dead connection
-        is_dead = any(indicator in error_str for indicator in dead_connection_indicators)
+        is_dead = DEAD_CONNECTION_PATTERN.search(str(error)) is not None
         
         if is_dead or self.connection_error_count >= self.max_connection_errors:
             self.mark_dead(f"{error_type}: {error}")
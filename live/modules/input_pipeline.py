@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import threading
 import time
 from pathlib import Path
@@ -14,11 +15,28 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from live.live_ui import system_log
 
+# Maximum number of queued user messages coalesced into a single send
+MAX_TEXT_BATCH = 4
+# Pending user messages kept while disconnected (oldest dropped beyond this)
+MAX_PENDING_INPUT = 20
+
 class InputPipeline:
     def __init__(self, connection_manager):
         self.connection_manager = connection_manager
-        self.user_input_queue = asyncio.Queue(maxsize=20)
+        # Bounded drop-oldest backlog + wakeup event; only touched on the event loop thread
+        self.pending_input = collections.deque(maxlen=MAX_PENDING_INPUT)
+        self._input_ready = asyncio.Event()
         self.input_thread = None
+        self.on_activity = None  # Optional callback run on each submitted message (set by the orchestrator)
+    
+    def submit(self, text: str):
+        """Queue a user message (call on the loop thread, e.g. via call_soon_threadsafe)."""
+        if len(self.pending_input) == MAX_PENDING_INPUT:
+            system_log.info(f"User input backlog full ({MAX_PENDING_INPUT} messages), dropping the oldest", category="INPUT")
+        self.pending_input.append(text)
+        self._input_ready.set()
+        if self.on_activity:
+            self.on_activity()
         
     def start(self, loop):
         """Start the persistent input thread."""
@@ -40,7 +58,7 @@ class InputPipeline:
                 
                 # Put into async queue safely
                 if loop.is_running():
-                    loop.call_soon_threadsafe(self.user_input_queue.put_nowait, text)
+                    loop.call_soon_threadsafe(self.submit, text)
                 else:
                     system_log.info("Loop not running, exiting input thread", category="INPUT")
                     break
@@ -54,28 +72,54 @@ class InputPipeline:
 
     async def send_text(self):
         """Send text input to the session with connection health checks."""
+        pending = self.pending_input
         while True:
             try:
-                # Read from persistent queue instead of blocking input()
-                text = await self.user_input_queue.get()
+                await self._input_ready.wait()
+                if not pending:
+                    self._input_ready.clear()
+                    continue
+                
+                session = self.connection_manager.session
+                if session is None or not self.connection_manager.healthy:
+                    # Same order as when connected: an exit command only takes effect once the
+                    # messages typed before it are sent, so exit at once only if none are queued
+                    if pending[0].lower() == "q":
+                        raise asyncio.CancelledError("User requested exit")
+                    queued_before_exit = next((i for i, queued in enumerate(pending) if queued.lower() == "q"), None)
+                    if queued_before_exit is not None:
+                        system_log.info(f"Exit requested; sending {queued_before_exit} earlier message(s) first once reconnected", category="INPUT")
+                    elif len(pending) > 10:  # Warn if the backlog is filling up
+                        system_log.info(f"User input backlog accumulating ({len(pending)}/{MAX_PENDING_INPUT} messages). Connection unhealthy.", category="INPUT")
+                    # Sleep until a session is ready; the backlog is sent in order then
+                    await self.connection_manager.wait_until_healthy()
+                    continue
                 
+                text = pending.popleft()
                 if text.lower() == "q":
                     raise asyncio.CancelledError("User requested exit")
                 
-                if not self.connection_manager.is_healthy():
-                    # Put back in queue to retry
-                    await self.user_input_queue.put(text)
-                    queue_size = self.user_input_queue.qsize()
-                    if queue_size > 10:  # Warn if queue is filling up
-                        system_log.info(f"User input queue accumulating ({queue_size}/20 messages). Connection unhealthy.", category="INPUT")
-                    await asyncio.sleep(1)
-                    continue
+                # Coalesce a burst of queued lines into one send (stops at an exit command)
+                exit_requested = False
+                batched = 1
+                while batched < MAX_TEXT_BATCH and pending:
+                    more = pending.popleft()
+                    if more.lower() == "q":
+                        exit_requested = True
+                        break
+                    text += "\n" + more
+                    batched += 1
+                if not pending:
+                    self._input_ready.clear()
 
-                await self.connection_manager.session.send_realtime_input(text=text)
+                await session.send_realtime_input(text=text)
                 
                 # Reset error counter on successful send
                 if self.connection_manager.connection_error_count > 0:
                     self.connection_manager.connection_error_count = 0
+                
+                if exit_requested:
+                    raise asyncio.CancelledError("User requested exit")
                     
             except asyncio.CancelledError:
                 raise
@@ -1,4 +1,5 @@
 import asyncio
+import re
 import time
 from pathlib import Path
 
@@ -20,13 +21,16 @@ from system_utils import orion_tts
 import os
 VIDEO_DEBUG = False
 PASSIVE_TIMER = 30
+HIGH_MOMENTUM_TIMER = 8.0  # Passive timeout while the screen is in high action
+HANDLE_LOG_INTERVAL = 10.0  # Seconds between "Received resumption token" log lines
+TIME_LEFT_RE = re.compile(r"\d+")  # Whole seconds in a GoAway time_left ('50s', '50.5s', 50)
 
 class ResponsePipeline:
     def __init__(self, connection_manager, session_manager, signals=None):
         self.connection_manager = connection_manager
         self.session_manager = session_manager
         self.signals = signals  # GUI signals (optional, None for CLI mode)
-        self.last_interaction_time = time.time()
+        self.last_interaction_time = time.monotonic()
         self.session_id = None # Will be set by live.py or session manager
         
         # Token counters
@@ -41,6 +45,20 @@ class ResponsePipeline:
         self.tokens_in_video = 0 # Image/Video
         self.tokens_out_text = 0
         self.tokens_out_audio = 0
+        
+        self._last_handle_log_time = 0.0
+        
+        # Strong refs to fire-and-forget tasks (the loop only keeps weak ones)
+        self._background_tasks = set()
+
+    async def wait_for_saves(self):
+        """Wait for in-flight resumption handle saves (before the final sync on shutdown)."""
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    def mark_activity(self):
+        """Restart the passive observer's idle timer (user input or AI output)."""
+        self.last_interaction_time = time.monotonic()
 
     async def handle_responses(self):
         while True:
@@ -51,43 +69,38 @@ class ResponsePipeline:
                         system_log.info(f"Response type: {type(response)}", category="VIDEO")
                     
                     # Handle SessionResumptionUpdate messages
-                    if hasattr(response, 'session_resumption_update') and response.session_resumption_update:
-                        update = response.session_resumption_update
-                        # Fix: Check for new_handle or handle
-                        handle = getattr(update, 'new_handle', None) or getattr(update, 'handle', None)
+                    # LiveServerMessage fields are always present (None when unset), so read them directly
+                    if update := response.session_resumption_update:
+                        handle = update.new_handle
                         
                         if handle:
-                            system_log.info(f"Received resumption token: {handle[:30]}...", category="SESSION")
-                            try:
-                                self.session_manager.save_state(
-                                    resumption_handle=handle,
-                                    session_id=self.session_id
-                                )
-                                system_log.info(f"Resumption token saved successfully", category="SESSION")
-                            except Exception as e:
-                                system_log.info(f"ERROR: Failed to save resumption token: {e}", category="SESSION")
+                            # Tokens arrive often; save every one but only log sparsely
+                            now = time.monotonic()
+                            if now - self._last_handle_log_time > HANDLE_LOG_INTERVAL:
+                                system_log.info(f"Received resumption token: {handle[:30]}...", category="SESSION")
+                                self._last_handle_log_time = now
+                            # Fire-and-forget: the write runs in a thread while we keep receiving
+                            # (save_state logs its own success/failure)
+                            save_task = asyncio.create_task(self.session_manager.save_state_async(
+                                resumption_handle=handle,
+                                session_id=self.session_id
+                            ))
+                            self._background_tasks.add(save_task)
+                            save_task.add_done_callback(self._background_tasks.discard)
                         else:
                             if VIDEO_DEBUG:
                                 system_log.info(f"SessionResumptionUpdate received but no handle found: {update}", category="SESSION")
                     
                     # Handle GoAway message (connection termination warning)
-                    if hasattr(response, 'go_away') and response.go_away:
-                        go_away = response.go_away
-                        time_left_raw = getattr(go_away, 'time_left', 0)
+                    if go_away := response.go_away:
+                        time_left_raw = go_away.time_left
                         
-                        # Convert to integer (API may return string like '50s' or int)
-                        time_left = 0
-                        try:
-                            if isinstance(time_left_raw, (int, float)):
-                                time_left = int(time_left_raw)
-                            elif isinstance(time_left_raw, str):
-                                # Handle formats like '50s', '50', etc.
-                                time_left_str = time_left_raw.strip().rstrip('sS').strip()
-                                time_left = int(time_left_str) if time_left_str else 0
-                            else:
-                                time_left = int(time_left_raw) if time_left_raw else 0
-                        except (ValueError, TypeError) as e:
-                            system_log.info(f"Warning: Could not parse time_left '{time_left_raw}' ({type(time_left_raw).__name__}), defaulting to 0. Error: {e}", category="SESSION")
+                        # Convert to integer (API may return string like '50s', an int, or None)
+                        match = TIME_LEFT_RE.search(str(time_left_raw or 0))
+                        if match:
+                            time_left = int(match.group())
+                        else:
+                            system_log.info(f"Warning: Could not parse time_left '{time_left_raw}' ({type(time_left_raw).__name__}), defaulting to 0", category="SESSION")
                             time_left = 0
                         
                         system_log.info(f"\n[SESSION] GoAway received. Time left: {time_left} seconds", category="SESSION")
@@ -100,14 +113,14 @@ class ResponsePipeline:
                         raise GoAwayReconnection("GoAway received, reconnecting...")
                     
                     # Handle context window compression updates (optional monitoring)
-                    if hasattr(response, 'context_window_compression_update') and response.context_window_compression_update:
-                        if VIDEO_DEBUG:
-                            update = response.context_window_compression_update
-                            system_log.info(f"Context compression update: {update}", category="SESSION")
+                    # (not a LiveServerMessage field in every SDK version, so only probed in debug mode)
+                    if VIDEO_DEBUG and (update := getattr(response, 'context_window_compression_update', None)):
+                        system_log.info(f"Context compression update: {update}", category="SESSION")
                     
                     # Handle text responses
                     #print(response)
                     if text := response.text:
+                        self.mark_activity()
                         if orion_tts:
                             orion_tts.process_stream_chunk(text)
                         conversation.stream_ai(text)
@@ -201,55 +214,85 @@ class ResponsePipeline:
         Passive observer that triggers AI commentary when user is quiet.
         Uses Visual Momentum to trigger faster responses during high-action scenes.
         """
-        while True:
-            # Check if AI is speaking first (cheap check)
-            if orion_tts.IS_SPEAKING:
-                self.last_interaction_time = time.time()
-                await asyncio.sleep(1.0)
-                continue
-            
-            # Check connection health before proceeding
-            if not self.connection_manager.is_healthy():
-                if VIDEO_DEBUG:
-                    system_log.info("Connection not healthy, passive observer waiting...", category="PASSIVE")
-                await asyncio.sleep(10.0)
-                continue
-            
-            # Determine dynamic timeout based on Visual Momentum
-            current_timeout = PASSIVE_TIMER
-            momentum = 0.0
-            
-            if hasattr(self, 'video_pipeline') and self.video_pipeline:
-                momentum = self.video_pipeline.get_momentum()
-                # If momentum is high (e.g., > 20), reduce timeout significantly
-                if momentum > 20.0:
-                    current_timeout = 8.0  # React quickly to action
+        loop = asyncio.get_running_loop()
+        tts_idle = asyncio.Event()
+        if not orion_tts.IS_SPEAKING:
+            tts_idle.set()
+        
+        def on_speaking_changed(speaking: bool):
+            """Called on the TTS thread; hands the state change to the event loop."""
+            def apply():
+                if speaking:
+                    tts_idle.clear()
+                else:
+                    # Finishing speech counts as interaction, even if it started and ended mid-sleep
+                    self.mark_activity()
+                    tts_idle.set()
+            try:
+                loop.call_soon_threadsafe(apply)
+            except RuntimeError:
+                pass  # Loop already closed
+        
+        orion_tts.add_speaking_listener(on_speaking_changed)
+        try:
+            while True:
+                # While the AI is speaking, sleep until it stops (no polling)
+                if not tts_idle.is_set():
+                    await tts_idle.wait()
+                    continue
+                
+                # Check connection health before proceeding
+                if not self.connection_manager.healthy:
                     if VIDEO_DEBUG:
-                        system_log.info(f"High Momentum ({momentum:.1f}) detected! Reduced timeout to {current_timeout}s", category="PASSIVE")
-            
-            # Check if timer has expired
-            time_since_interaction = time.time() - self.last_interaction_time
-            
-            if time_since_interaction > current_timeout:
-                system_log.info(f"Triggering Passive Observation (Timeout: {current_timeout}s, Momentum: {momentum:.1f})", category="PASSIVE")
-                try:
-                    # Contextual prompt based on momentum
-                    prompt = "[SYSTEM: The user has been quiet. Briefly comment on what you see.]"
+                        system_log.info("Connection not healthy, passive observer waiting...", category="PASSIVE")
+                    await self.connection_manager.wait_until_healthy()
+                    continue
+                
+                # Determine dynamic timeout based on Visual Momentum
+                current_timeout = PASSIVE_TIMER
+                momentum = 0.0
+                
+                if hasattr(self, 'video_pipeline') and self.video_pipeline:
+                    momentum = self.video_pipeline.get_momentum()
+                    # If momentum is high (e.g., > 20), reduce timeout significantly
                     if momentum > 20.0:
-                        prompt = "[SYSTEM: The user is silent but the screen is moving fast (High Action). Comment about the action happening NOW.]"
-                    
-                    await self.connection_manager.session.send_realtime_input(text=prompt)
-                    
-                    # Reset error counter on successful send
-                    if self.connection_manager.connection_error_count > 0:
-                        self.connection_manager.connection_error_count = 0
-                except Exception as e:
-                    is_dead = self.connection_manager.handle_error(e)
-                    if is_dead:
-                        system_log.info(f"Connection dead, skipping passive prompt. Will retry after reconnection.", category="PASSIVE")
-                    else:
-                        system_log.info(f"Error sending passive prompt (will retry): {e}", category="PASSIVE")
-                self.last_interaction_time = time.time()
-            
-            # Normal operation: check every second
-            await asyncio.sleep(1.0)
+                        current_timeout = HIGH_MOMENTUM_TIMER  # React quickly to action
+                        if VIDEO_DEBUG:
+                            system_log.info(f"High Momentum ({momentum:.1f}) detected! Reduced timeout to {current_timeout}s", category="PASSIVE")
+                
+                # Check if timer has expired
+                time_since_interaction = time.monotonic() - self.last_interaction_time
+                
+                if time_since_interaction > current_timeout:
+                    system_log.info(f"Triggering Passive Observation (Timeout: {current_timeout}s, Momentum: {momentum:.1f})", category="PASSIVE")
+                    try:
+                        # Contextual prompt based on momentum
+                        prompt = "[SYSTEM: The user has been quiet. Briefly comment on what you see.]"
+                        if momentum > 20.0:
+                            prompt = "[SYSTEM: The user is silent but the screen is moving fast (High Action). Comment about the action happening NOW.]"
+                        
+                        await self.connection_manager.session.send_realtime_input(text=prompt)
+                        
+                        # Reset error counter on successful send
+                        if self.connection_manager.connection_error_count > 0:
+                            self.connection_manager.connection_error_count = 0
+                    except Exception as e:
+                        is_dead = self.connection_manager.handle_error(e)
+                        if is_dead:
+                            system_log.info(f"Connection dead, skipping passive prompt. Will retry after reconnection.", category="PASSIVE")
+                        else:
+                            system_log.info(f"Error sending passive prompt (will retry): {e}", category="PASSIVE")
+                    self.last_interaction_time = time.monotonic()
+                    continue
+                
+                # Sleep until the timer can next expire: the high-momentum deadline while it is
+                # still ahead, then re-read momentum every second until the full timeout.
+                # mark_activity() only moves the deadline; it is picked up on the next wakeup
+                wake_in = current_timeout - time_since_interaction
+                if time_since_interaction < HIGH_MOMENTUM_TIMER:
+                    wake_in = min(wake_in, HIGH_MOMENTUM_TIMER - time_since_interaction)
+                else:
+                    wake_in = min(wake_in, 1.0)
+                await asyncio.sleep(wake_in)
+        finally:
+            orion_tts.remove_speaking_listener(on_speaking_changed)
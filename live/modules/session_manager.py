@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import time
@@ -17,17 +18,57 @@ if str(PROJECT_ROOT) not in sys.path:
 from main_utils import config
 from live.live_ui import system_log
 
+# Optional fast JSON codec (falls back to the stdlib json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Session state file path
 SESSION_STATE_FILE = os.path.join(config.PROJECT_ROOT, "data", "live_session_state.json")
+STATE_FSYNC_EVERY = 10  # fsync every Nth save; sync() flushes the rest on shutdown
+SAVE_LOG_INTERVAL = 10.0  # Seconds between "Saved resumption handle" log lines
+
+def _dumps_state(state: dict) -> bytes:
+    """Serialize the state dict to compact UTF-8 JSON (machine-read only)."""
+    if orjson is not None:
+        return orjson.dumps(state)
+    return json.dumps(state, separators=(',', ':')).encode('utf-8')
+
+
+def _loads_state(data: bytes) -> dict:
+    """Parse the state file contents (orjson.JSONDecodeError subclasses json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _state_age_seconds(last_update) -> float:
+    """
+    Seconds since last_update: a float epoch, or an ISO-8601 string written by older
+    versions. Raises ValueError/TypeError if the value can't be interpreted.
+    """
+    if isinstance(last_update, (int, float)):
+        return time.time() - last_update
+    # Legacy ISO timestamp (handle both with and without 'Z' suffix)
+    last_update_time = datetime.fromisoformat(last_update.replace('Z', '+00:00'))
+    return (datetime.now(timezone.utc) - last_update_time).total_seconds()
+
 
 class LiveSessionState:
     """Manages Live API session state for resumption."""
     
+    __slots__ = ("state_file", "resumption_handle", "session_id", "last_update", "_dirty_saves", "_save_lock", "_save_lock_loop", "_last_save_log_time")
+    
     def __init__(self, state_file: str = SESSION_STATE_FILE):
         self.state_file = state_file
         self.resumption_handle = None
         self.session_id = None
         self.last_update = None
+        self._dirty_saves = 0  # Saves written since the last fsync
+        self._save_lock = None  # Serializes save_state_async writers, in arrival order (created per loop)
+        self._save_lock_loop = None
+        self._last_save_log_time = 0.0  # Monotonic time of the last "Saved" log line
         self._ensure_state_directory()
     
     def _ensure_state_directory(self):
@@ -44,40 +85,36 @@ class LiveSessionState:
         """
         try:
             if os.path.exists(self.state_file):
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
-                    self.resumption_handle = state.get("resumption_handle")
-                    self.session_id = state.get("session_id")
-                    self.last_update = state.get("last_update")
-                    
-                    # Check if handle is still valid (2 hour window from last update)
-                    if self.last_update:
-                        try:
-                            # Parse timestamp (handle both with and without 'Z' suffix)
-                            last_update_str = self.last_update.replace('Z', '+00:00')
-                            last_update_time = datetime.fromisoformat(last_update_str)
-                            time_diff = (datetime.now(timezone.utc) - last_update_time).total_seconds()
-                            
-                            if time_diff > 7200:  # 2 hours = 7200 seconds
-                                hours_old = time_diff / 3600
-                                system_log.info(f"Resumption handle expired ({hours_old:.1f} hours old, >2 hour limit). Starting new session.", category="SESSION")
-                                self.clear_state()
-                                return None
-                            else:
-                                # Handle is still valid
-                                hours_remaining = (7200 - time_diff) / 3600
-                                if self.resumption_handle:
-                                    system_log.info(f"Loaded resumption handle: {self.resumption_handle[:30]}... (valid for {hours_remaining:.1f} more hours)", category="SESSION")
-                                    return self.resumption_handle
-                        except (ValueError, TypeError) as e:
-                            system_log.info(f"Error parsing timestamp '{self.last_update}': {e}. Starting new session.", category="SESSION")
+                state = _loads_state(Path(self.state_file).read_bytes())
+                self.resumption_handle = state.get("resumption_handle")
+                self.session_id = state.get("session_id")
+                self.last_update = state.get("last_update")
+                
+                # Check if handle is still valid (2 hour window from last update)
+                if self.last_update:
+                    try:
+                        time_diff = _state_age_seconds(self.last_update)
+                        
+                        if time_diff > 7200:  # 2 hours = 7200 seconds
+                            hours_old = time_diff / 3600
+                            system_log.info(f"Resumption handle expired ({hours_old:.1f} hours old, >2 hour limit). Starting new session.", category="SESSION")
                             self.clear_state()
                             return None
-                    else:
-                        # No timestamp, assume expired
-                        system_log.info("No timestamp in session state. Starting new session.", category="SESSION")
+                        else:
+                            # Handle is still valid
+                            hours_remaining = (7200 - time_diff) / 3600
+                            if self.resumption_handle:
+                                system_log.info(f"Loaded resumption handle: {self.resumption_handle[:30]}... (valid for {hours_remaining:.1f} more hours)", category="SESSION")
+                                return self.resumption_handle
+                    except (ValueError, TypeError) as e:
+                        system_log.info(f"Error parsing timestamp '{self.last_update}': {e}. Starting new session.", category="SESSION")
                         self.clear_state()
                         return None
+                else:
+                    # No timestamp, assume expired
+                    system_log.info("No timestamp in session state. Starting new session.", category="SESSION")
+                    self.clear_state()
+                    return None
         except json.JSONDecodeError as e:
             system_log.info(f"Error parsing session state file (corrupted?): {e}. Starting new session.", category="SESSION")
             self.clear_state()
@@ -89,23 +126,65 @@ class LiveSessionState:
         return None
     
     def save_state(self, resumption_handle: str, session_id: Optional[str] = None):
-        """Save resumption handle for future use."""
+        """Save resumption handle for future use (also refreshes last_update for an unchanged handle)."""
         try:
             state = {
                 "resumption_handle": resumption_handle,
                 "session_id": session_id or self.session_id,
-                "last_update": datetime.now(timezone.utc).isoformat()
+                "last_update": time.time()  # Epoch seconds (wall clock: must survive restarts)
             }
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            self._write_atomic(_dumps_state(state))
             self.resumption_handle = resumption_handle
             if session_id:
                 self.session_id = session_id
             self.last_update = state["last_update"]
-            system_log.info(f"Saved resumption handle: {resumption_handle[:30]}...", category="SESSION")
+            # Handles arrive on every update; only log (and format) one now and then
+            now = time.monotonic()
+            if now - self._last_save_log_time > SAVE_LOG_INTERVAL:
+                system_log.info(f"Saved resumption handle: {resumption_handle[:30]}...", category="SESSION")
+                self._last_save_log_time = now
         except Exception as e:
             system_log.info(f"Error saving session state: {e}", category="SESSION")
     
+    async def save_state_async(self, resumption_handle: str, session_id: Optional[str] = None):
+        """Run save_state in a worker thread so disk I/O never stalls the receive loop."""
+        loop = asyncio.get_running_loop()
+        if self._save_lock_loop is not loop:
+            # The GUI restarts sessions on a new loop, and an asyncio.Lock belongs to one loop
+            self._save_lock = asyncio.Lock()
+            self._save_lock_loop = loop
+        async with self._save_lock:
+            await asyncio.to_thread(self.save_state, resumption_handle, session_id)
+    
+    def _write_atomic(self, data: bytes):
+        """
+        Write via a temp file + os.replace so a crash never leaves a torn state file.
+        Only every STATE_FSYNC_EVERY-th write is fsynced; sync() covers the rest.
+        """
+        self._dirty_saves += 1
+        fsync = self._dirty_saves >= STATE_FSYNC_EVERY
+        tmp_file = self.state_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_file, self.state_file)
+        if fsync:
+            self._dirty_saves = 0
+    
+    def sync(self):
+        """Flush any un-fsynced state to disk (called on shutdown)."""
+        if not self._dirty_saves:
+            return
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'rb+') as f:
+                    os.fsync(f.fileno())
+            self._dirty_saves = 0
+        except Exception as e:
+            system_log.info(f"Error syncing session state: {e}", category="SESSION")
+    
     def clear_state(self):
         """Clear saved state (after successful resumption or expiration)."""
         try:
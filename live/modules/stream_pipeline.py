@@ -128,7 +128,7 @@ class StreamPipeline:
                     break
                 
                 # Send to Gemini
-                if self.connection_manager.is_healthy():
+                if self.connection_manager.healthy:
                     await self.connection_manager.session.send_realtime_input(
                         media=types.Blob(data=data, mime_type="video/mp4")
                     )
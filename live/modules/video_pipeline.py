@@ -1,13 +1,19 @@
 import asyncio
-import io
+import collections
+import concurrent.futures
 import time
 import cv2
 import mss
 import numpy as np
-from PIL import Image
 from pathlib import Path
 from typing import Optional, List, Dict
 
+# Optional libjpeg-turbo encoder (falls back to OpenCV when unavailable)
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
 # Import system_log and debug monitor
 # Import system_log and debug monitor
 import sys
@@ -23,33 +29,143 @@ from live.debug_monitor import get_monitor
 from live.modules.window_selector import WindowSelector
 from google.genai import types
 
+# Optional DXGI Desktop Duplication capture on Windows (faster than MSS/GDI)
+dxcam = None
+if sys.platform == "win32":
+    try:
+        import dxcam
+    except ImportError:
+        dxcam = None
+
 # Check if debug mode is enabled
 import os
 VIDEO_DEBUG = False
 VIDEO_CAPTURE_INTERVAL = 4.0  # Seconds between frame captures
+STATIC_FRAME_REFRESH = 20.0  # Resend an unchanged frame at most this often
+STALE_FRAME_AGE = 2 * VIDEO_CAPTURE_INTERVAL  # Frames older than this are dropped instead of sent
+# Near-duplicate detection on a small grayscale thumbnail of each frame: a frame counts
+# as unchanged when at most STATIC_FRAME_MAX_CELLS cells differ by more than
+# STATIC_FRAME_TOLERANCE grey levels from the last frame sent (cursor blink, clock tick)
+STATIC_FRAME_THUMB_SIZE = (48, 27)
+STATIC_FRAME_TOLERANCE = 8
+STATIC_FRAME_MAX_CELLS = 2
+
+# Resize to reduce token usage (bounding box, aspect ratio preserved)
+# Gemini 2.0+ tiles large images (258 tokens per 768x768 tile)
+# 1080p (1920x1080) -> ~6 tiles -> ~1548 tokens
+# Resizing to 1024x576 -> ~2 tiles -> ~516 tokens
+# Resizing to 768x432 -> 1 tile -> 258 tokens
+FRAME_MAX_SIZE = (768, 432)
+
+IMAGE_MIME_TYPE = sys.intern("image/jpeg")
+
+
+def _parse_capture_region(value: Optional[str]):
+    """Parse a "left,top,width,height" region (pixels, relative to the primary monitor)."""
+    if not value:
+        return None
+    try:
+        left, top, width, height = (int(part) for part in value.split(","))
+    except ValueError:
+        system_log.info(f"Ignoring invalid SCREEN_CAPTURE_REGION: {value!r}", category="VIDEO")
+        return None
+    if width <= 0 or height <= 0:
+        system_log.info(f"Ignoring empty SCREEN_CAPTURE_REGION: {value!r}", category="VIDEO")
+        return None
+    return left, top, width, height
+
+# Optional crop of the primary monitor, e.g. SCREEN_CAPTURE_REGION=0,0,1920,1080 to grab
+# just the game/app area instead of the whole desktop
+SCREEN_CAPTURE_REGION = _parse_capture_region(os.getenv("SCREEN_CAPTURE_REGION"))
+
+# Live-stream JPEG settings: moderate quality, baseline (non-progressive), no Huffman optimisation,
+# 4:2:0 chroma subsampling (simplejpeg defaults to 4:4:4, which carries twice the chroma data)
+JPEG_QUALITY = int(os.getenv("VIDEO_JPEG_QUALITY", "60"))
+JPEG_SUBSAMPLING = "420"
+CV2_JPEG_PARAMS = [
+    cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY,
+    cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+    cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+    cv2.IMWRITE_JPEG_SAMPLING_FACTOR, cv2.IMWRITE_JPEG_SAMPLING_FACTOR_420,
+]
+
+# Latency-driven quality control: step down under congestion, recover to JPEG_QUALITY
+JPEG_QUALITY_MIN = 30
+JPEG_QUALITY_STEP_DOWN = 10
+JPEG_QUALITY_STEP_UP = 5
+HIGH_LATENCY_THRESHOLD = 1.5  # Seconds; 3 consecutive frames above this lower quality
+LOW_LATENCY_THRESHOLD = 0.5   # Seconds; 10 consecutive frames below this raise quality
+
+
+def _fit_frame(arr: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Downscale an image array to fit FRAME_MAX_SIZE (aspect ratio preserved, never upscales).
+    Writes into `out` when it already has the target shape, avoiding a per-frame allocation.
+    """
+    height, width = arr.shape[:2]
+    scale = min(FRAME_MAX_SIZE[0] / width, FRAME_MAX_SIZE[1] / height, 1.0)
+    if scale < 1.0:
+        size = (int(width * scale), int(height * scale))
+        if out is not None and out.shape == (size[1], size[0]) + arr.shape[2:]:
+            return cv2.resize(arr, size, dst=out, interpolation=cv2.INTER_AREA)
+        arr = cv2.resize(arr, size, interpolation=cv2.INTER_AREA)
+    return arr
+
+
+def _cv2_jpeg_params(quality: int) -> List[int]:
+    """OpenCV imencode params for the given quality (shared list at the default)."""
+    if quality == JPEG_QUALITY:
+        return CV2_JPEG_PARAMS
+    return [cv2.IMWRITE_JPEG_QUALITY, quality, *CV2_JPEG_PARAMS[2:]]
+
+
+def _encode_jpeg(arr: np.ndarray, colorspace: str, quality: int = JPEG_QUALITY) -> bytes:
+    """JPEG-encode an RGB, BGR or BGRX/BGRA array with libjpeg-turbo, falling back to OpenCV."""
+    if simplejpeg is not None:
+        # libjpeg-turbo reads the input layout directly, no separate colour-conversion pass
+        return simplejpeg.encode_jpeg(
+            np.ascontiguousarray(arr), quality=quality, colorspace=colorspace,
+            colorsubsampling=JPEG_SUBSAMPLING, fastdct=True,
+        )
+    
+    if colorspace == 'RGB':
+        arr = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+    # OpenCV's JPEG writer drops the alpha channel row by row while encoding,
+    # so BGRA buffers go straight in without a full-frame cvtColor pass
+    _, buffer = cv2.imencode('.jpg', arr, _cv2_jpeg_params(quality))
+    return buffer.tobytes()
+
 
 class VideoPipeline:
     def __init__(self, connection_manager, mode="screen", signals=None):
         self.connection_manager = connection_manager
         self.mode = mode
-        self.video_out_queue = asyncio.Queue(maxsize=1)
-        self.frame_stats = {
-            "captured": 0,
-            "sent": 0,
-            "dropped": 0,
-            "total_latency": 0.0,
-            "max_latency": 0.0,
-        }
+        # Latest-frame slot: deque(maxlen=1) discards the stale frame on append
+        self._video_slot = collections.deque(maxlen=1)
+        self._video_ready = asyncio.Event()
+        # Per-frame counters as plain attributes; folded into a dict only by frame_stats
+        self._stat_captured = 0
+        self._stat_sent = 0
+        self._stat_dropped = 0
+        self._stat_unchanged = 0
+        self._stat_total_latency = 0.0
+        self._stat_max_latency = 0.0
+        
+        # Adaptive JPEG quality, driven by send latency in send_realtime_image
+        self._jpeg_quality = JPEG_QUALITY
+        self._high_latency_streak = 0
+        self._low_latency_streak = 0
         self.debug_monitor = get_monitor()
         self.signals = signals
         
         # Stats
         self.frame_count = 0
-        self.last_stats_time = time.time()
+        self.last_stats_time = time.monotonic()
         self.fps = 0.0
         
         # Visual Momentum State
         self.last_frame_gray = None
+        self._gray_spare = None
         self.momentum_score = 0.0
         self.momentum_history = []
         
@@ -59,44 +175,213 @@ class VideoPipeline:
         self.selected_window_title = None
         self.window_capture_fallback = False  # If window capture fails, fallback to screen
         
+        # Persistent MSS handle + monitor, reused across captures and reconnects
+        self._sct = None
+        self._monitor = None
+        
+        # DXcam capture device (Windows only, preferred over MSS when available)
+        self._dxcam = None
+        self._dxcam_disabled = dxcam is None
+        self._last_dxcam_frame = None
+        
+        # Single dedicated worker for capture + encode: keeps the default pool free for
+        # audio I/O and pins the thread-affine MSS/DXcam handles to one thread
+        self._video_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='video')
+        
+        # Downscaled frame buffers, reused by _fit_frame while the capture size is stable
+        # (only touched on the video worker, one frame at a time)
+        self._screen_buf = None
+        self._window_buf = None
+        self._camera_buf = None
+        
+        # Thumbnail of the last encoded frame, used to skip static screens
+        self._last_frame_thumb = None
+        self._last_frame_thumb_time = 0.0
+        
         # Start stats task
         self.stats_task = None
 
-    def _calculate_momentum(self, frame_data):
+    def _calculate_momentum(self, frame: np.ndarray, to_gray: int):
         """
         Calculate visual momentum (motion intensity) from frame differences.
+        Works on the raw capture array (no JPEG decode); the two grayscale
+        buffers are swapped and reused from frame to frame.
         """
         try:
-            # Decode frame to numpy array
-            nparr = np.frombuffer(frame_data, np.uint8)
-            frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            
-            if frame is None:
-                return
-
-            # Convert to grayscale for simpler diffing
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            # Convert to grayscale for simpler diffing, into the spare buffer when it fits
+            gray = self._gray_spare
+            if gray is None or gray.shape != frame.shape[:2]:
+                gray = np.empty(frame.shape[:2], dtype=np.uint8)
+            cv2.cvtColor(frame, to_gray, dst=gray)
             
-            if self.last_frame_gray is not None:
-                # Calculate absolute difference
-                diff = cv2.absdiff(gray, self.last_frame_gray)
-                # Mean intensity of difference (0-255)
-                score = np.mean(diff)
+            previous = self.last_frame_gray
+            if previous is not None and previous.shape == gray.shape:
+                # Mean intensity of absolute difference (0-255), no diff image allocated
+                score = cv2.norm(gray, previous, cv2.NORM_L1) / gray.size
                 
                 # Update rolling average (smooth out spikes)
                 self.momentum_score = (self.momentum_score * 0.7) + (score * 0.3)
-                
-                # Update debug monitor
-                if self.debug_monitor:
-                    # We can add a momentum bar or just log it
-                    pass
             
+            self._gray_spare = previous
             self.last_frame_gray = gray
             
         except Exception as e:
             if VIDEO_DEBUG:
                 system_log.info(f"Momentum calc error: {e}", category="VIDEO")
 
+    def _get_screen_grabber(self):
+        """
+        Return the persistent MSS handle and capture area, creating them on first use.
+        The area is the primary monitor, cropped to SCREEN_CAPTURE_REGION when set.
+        """
+        if self._sct is None:
+            self._sct = mss.mss()
+            monitor = self._sct.monitors[1]
+            if SCREEN_CAPTURE_REGION:
+                left, top, width, height = SCREEN_CAPTURE_REGION
+                monitor = {
+                    "left": monitor["left"] + left,
+                    "top": monitor["top"] + top,
+                    "width": width,
+                    "height": height,
+                }
+            self._monitor = monitor
+        return self._sct, self._monitor
+
+    def _grab_screen(self) -> np.ndarray:
+        """Grab the capture area as a BGRA array (DXcam on Windows, MSS elsewhere)."""
+        if not self._dxcam_disabled:
+            try:
+                if self._dxcam is None:
+                    region = None
+                    if SCREEN_CAPTURE_REGION:
+                        left, top, width, height = SCREEN_CAPTURE_REGION
+                        region = (left, top, left + width, top + height)
+                    self._dxcam = dxcam.create(output_color="BGRA", region=region)
+                    system_log.info("Using DXcam for screen capture", category="VIDEO")
+                # grab() returns None when the desktop has not changed since the last grab
+                frame = self._dxcam.grab()
+                if frame is not None:
+                    self._last_dxcam_frame = frame
+                if self._last_dxcam_frame is not None:
+                    return self._last_dxcam_frame
+            except Exception as e:
+                system_log.info(f"DXcam capture failed, falling back to MSS: {e}", category="VIDEO")
+                self._dxcam_disabled = True
+        
+        sct, monitor = self._get_screen_grabber()
+        return np.asarray(sct.grab(monitor))
+
+    def _release_capture(self):
+        """Release the persistent screen capture handles (runs on the video worker thread)."""
+        if self._dxcam is not None:
+            self._dxcam.release()
+            self._dxcam = None
+            self._last_dxcam_frame = None
+        if self._sct is not None:
+            self._sct.close()
+            self._sct = None
+            self._monitor = None
+            if VIDEO_DEBUG:
+                system_log.info("MSS context closed", category="VIDEO")
+
+    def close(self):
+        """Release the capture handles on their owning thread and stop the video worker."""
+        try:
+            self._video_executor.submit(self._release_capture).result(timeout=2.0)
+        except Exception as e:
+            system_log.info(f"Error releasing screen capture: {e}", category="VIDEO")
+        self._video_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _capture_frame(self):
+        """
+        Grab the primary monitor and downscale it.
+        Returns (array, colorspace) for _encode_jpeg; the raw BGRA buffer is encoded
+        directly, skipping the PIL image/BytesIO round-trip.
+        """
+        self._screen_buf = _fit_frame(self._grab_screen(), self._screen_buf)
+        return self._screen_buf, 'BGRX'
+
+    def _frame_unchanged(self, arr: np.ndarray, colorspace: str) -> bool:
+        """
+        Return True if the frame is a near-duplicate of the last one that was encoded.
+        Compares grayscale thumbnails against the last frame sent, so slow drift still
+        adds up; a matching frame is let through every STATIC_FRAME_REFRESH seconds.
+        """
+        thumb = cv2.resize(arr, STATIC_FRAME_THUMB_SIZE, interpolation=cv2.INTER_AREA)
+        thumb = cv2.cvtColor(thumb, cv2.COLOR_RGB2GRAY if colorspace == 'RGB' else cv2.COLOR_BGRA2GRAY)
+        now = time.monotonic()
+        previous = self._last_frame_thumb
+        if previous is not None and now - self._last_frame_thumb_time < STATIC_FRAME_REFRESH:
+            changed = np.count_nonzero(cv2.absdiff(thumb, previous) > STATIC_FRAME_TOLERANCE)
+            if changed <= STATIC_FRAME_MAX_CELLS:
+                return True
+        self._last_frame_thumb = thumb
+        self._last_frame_thumb_time = now
+        return False
+
+    def _produce_frame(self, window_frame: Optional[np.ndarray] = None) -> Optional[bytes]:
+        """
+        Capture, downscale and JPEG-encode one frame on the video worker thread.
+        Uses window_frame (RGB) when given, otherwise grabs the screen.
+        Returns None when the frame is unchanged since the last one sent.
+        """
+        if window_frame is not None:
+            self._window_buf = _fit_frame(window_frame, self._window_buf)
+            captured = (self._window_buf, 'RGB')
+        else:
+            captured = self._capture_frame()
+        
+        if self._frame_unchanged(*captured):
+            return None
+        
+        img_bytes = _encode_jpeg(*captured, self._jpeg_quality)
+        self._calculate_momentum(captured[0], cv2.COLOR_RGB2GRAY if captured[1] == 'RGB' else cv2.COLOR_BGRA2GRAY)
+        return img_bytes
+
+    def _read_camera_frame(self, cap) -> Optional[bytes]:
+        """Read, downscale and JPEG-encode one camera frame on the video worker thread."""
+        ret, frame = cap.read()
+        if not ret:
+            return None
+        
+        # Resize frame for token optimization (same single-tile bound as screen frames)
+        self._camera_buf = frame = _fit_frame(frame, self._camera_buf)
+
+        # Encode to JPEG (simplejpeg takes OpenCV's BGR layout as-is)
+        img_bytes = _encode_jpeg(frame, 'BGR', self._jpeg_quality)
+        
+        self._calculate_momentum(frame, cv2.COLOR_BGR2GRAY)
+        return img_bytes
+
+    def _adapt_jpeg_quality(self, latency: float):
+        """Lower JPEG quality while frames arrive late, and relax back once latency recovers."""
+        if latency > HIGH_LATENCY_THRESHOLD:
+            self._low_latency_streak = 0
+            self._high_latency_streak += 1
+            if self._high_latency_streak >= 3 and self._jpeg_quality > JPEG_QUALITY_MIN:
+                self._jpeg_quality = max(JPEG_QUALITY_MIN, self._jpeg_quality - JPEG_QUALITY_STEP_DOWN)
+                self._high_latency_streak = 0
+                system_log.info(f"High frame latency, lowering JPEG quality to {self._jpeg_quality}", category="VIDEO")
+        elif latency < LOW_LATENCY_THRESHOLD:
+            self._high_latency_streak = 0
+            self._low_latency_streak += 1
+            if self._low_latency_streak >= 10 and self._jpeg_quality < JPEG_QUALITY:
+                self._jpeg_quality = min(JPEG_QUALITY, self._jpeg_quality + JPEG_QUALITY_STEP_UP)
+                self._low_latency_streak = 0
+                if VIDEO_DEBUG:
+                    system_log.info(f"Frame latency recovered, raising JPEG quality to {self._jpeg_quality}", category="VIDEO")
+        else:
+            self._high_latency_streak = 0
+            self._low_latency_streak = 0
+
+    def _publish_frame(self, data: bytes, timestamp: float):
+        """Store a (jpeg_bytes, capture_time) frame in the latest-frame slot and wake the sender."""
+        if self._video_slot:
+            self._stat_dropped += 1
+        self._video_slot.append((data, timestamp))
+        self._video_ready.set()
+
     def get_momentum(self):
         """Return current momentum score."""
         return self.momentum_score
@@ -106,26 +391,30 @@ class VideoPipeline:
         Captures screen frames using MSS or window capture based on mode.
         Supports both full screen capture and selective window capture.
         """
-        sct = None
         try:
-            # Initialize MSS for screen capture mode or fallback
             if self.mode == "screen" or not self.window_selector:
-                sct = mss.mss()
-                monitor = sct.monitors[1]
                 system_log.info("Starting screen capture mode", category="VIDEO")
             else:
                 system_log.info(f"Starting window capture mode (window: {self.selected_window_title or 'not selected'})", category="VIDEO")
             
+            # Hot-loop locals
+            run_in_executor = asyncio.get_running_loop().run_in_executor
+            executor = self._video_executor
+            connection_manager = self.connection_manager
+            publish = self._publish_frame
+            monotonic = time.monotonic
+            sleep = asyncio.sleep
+            
             while True:
                 # Check connection health before capturing
-                if not self.connection_manager.is_healthy():
+                if not connection_manager.healthy:
                     if VIDEO_DEBUG:
                         system_log.info("Connection not healthy, pausing capture...", category="VIDEO")
-                    await asyncio.sleep(5.0)
+                    await connection_manager.wait_until_healthy()
                     continue
                 
-                start_time = time.time()
-                img = None
+                start_time = monotonic()
+                window_frame = None
                 
                 # Determine capture method
                 if self.mode == "window" and self.window_selector and not self.window_capture_fallback:
@@ -133,65 +422,37 @@ class VideoPipeline:
                     if not self.window_selector.is_window_valid():
                         system_log.info("Selected window is no longer valid, falling back to screen capture", category="VIDEO")
                         self.window_capture_fallback = True
-                        # Initialize MSS for fallback
-                        if sct is None:
-                            sct = mss.mss()
-                            monitor = sct.monitors[1]
                     else:
                         # Capture window
-                        frame_array = self.window_selector.capture_window()
-                        if frame_array is not None:
-                            img = Image.fromarray(frame_array)
-                        else:
+                        window_frame = await run_in_executor(executor, self.window_selector.capture_window)
+                        if window_frame is None:
                             # Window capture failed, try again next iteration
                             if VIDEO_DEBUG:
                                 system_log.info("Window capture failed, retrying...", category="VIDEO")
-                            await asyncio.sleep(VIDEO_CAPTURE_INTERVAL)
+                            await sleep(VIDEO_CAPTURE_INTERVAL)
                             continue
                 
-                # Fall back to screen capture if needed or if in screen mode
-                if img is None:
-                    if sct is None:
-                        sct = mss.mss()
-                        monitor = sct.monitors[1]
-                    
-                    screenshot = sct.grab(monitor)
-                    img = Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
-
-                # Resize to reduce token usage (max 1024px)
-                # Gemini 2.0+ tiles large images (258 tokens per 768x768 tile)
-                # 1080p (1920x1080) -> ~6 tiles -> ~1548 tokens
-                # Resizing to 1024x576 -> ~2 tiles -> ~516 tokens
-                # Resizing to 768x432 -> 1 tile -> 258 tokens
-                img.thumbnail((768, 432))
-                
-                # Convert to bytes
-                img_byte_arr = io.BytesIO()
-                img.save(img_byte_arr, format='JPEG', quality=80)
-                img_bytes = img_byte_arr.getvalue()
+                # Encode the window frame, or fall back to screen capture
+                img_bytes = await run_in_executor(executor, self._produce_frame, window_frame)
                 
-                # Calculate momentum
-                self._calculate_momentum(img_bytes)
+                # Static screen: skip the send, let momentum decay
+                if img_bytes is None:
+                    self._stat_unchanged += 1
+                    self.momentum_score *= 0.7
+                    elapsed = monotonic() - start_time
+                    await sleep(max(0, VIDEO_CAPTURE_INTERVAL - elapsed))
+                    continue
                 
-                # Put in queue (non-blocking if full, drop old frames if needed)
-                if self.video_out_queue.full():
-                    try:
-                        self.video_out_queue.get_nowait()
-                        self.frame_stats["dropped"] += 1
-                    except asyncio.QueueEmpty:
-                        pass
+                # One clock read per frame: publish timestamp and FPS window
+                current_time = monotonic()
                 
-                await self.video_out_queue.put({
-                    "mime_type": "image/jpeg",
-                    "data": img_bytes,
-                    "timestamp": time.time()
-                })
+                # Publish as the latest frame (replaces any unsent one)
+                publish(img_bytes, current_time)
                 
-                self.frame_stats["captured"] += 1
+                self._stat_captured += 1
                 
                 # Calculate FPS
                 self.frame_count += 1
-                current_time = time.time()
                 if current_time - self.last_stats_time >= 1.0:
                     self.fps = self.frame_count / (current_time - self.last_stats_time)
                     self.frame_count = 0
@@ -209,19 +470,13 @@ class VideoPipeline:
                     self.debug_monitor.update_video_frame(img_bytes)
                 
                 # Wait for next capture interval
-                elapsed = time.time() - start_time
+                elapsed = monotonic() - start_time
                 wait_time = max(0, VIDEO_CAPTURE_INTERVAL - elapsed)
-                await asyncio.sleep(wait_time)
+                await sleep(wait_time)
         except Exception as e:
             system_log.info(f"Capture error: {e}", category="VIDEO")
             import traceback
             traceback.print_exc()
-        finally:
-            # Ensure MSS context is closed even if task is cancelled
-            if sct is not None:
-                sct.close()
-                if VIDEO_DEBUG: 
-                    system_log.info("MSS context closed", category="VIDEO")
 
     async def get_frames(self):
         """
@@ -232,61 +487,47 @@ class VideoPipeline:
         if not cap.isOpened():
             system_log.info("Cannot open camera", category="VIDEO")
             return
+        
+        # Frames are read every few seconds: keep only the newest one in the driver queue
+        # so read() returns a current frame instead of one buffered seconds ago
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             
+        # Hot-loop locals
+        run_in_executor = asyncio.get_running_loop().run_in_executor
+        executor = self._video_executor
+        read_frame = self._read_camera_frame
+        connection_manager = self.connection_manager
+        publish = self._publish_frame
+        monotonic = time.monotonic
+        sleep = asyncio.sleep
+        
         while True:
-            if not self.connection_manager.is_healthy():
+            if not connection_manager.healthy:
                 if VIDEO_DEBUG:
                     system_log.info("Connection not healthy, pausing camera capture...", category="VIDEO")
-                await asyncio.sleep(5.0)  # Wait longer when connection is dead
+                await connection_manager.wait_until_healthy()
                 continue
             
-            start_time = time.time()
+            start_time = monotonic()
             
-            ret, frame = cap.read()
-            if not ret:
+            img_bytes = await run_in_executor(executor, read_frame, cap)
+            if img_bytes is None:
                 system_log.info("Can't receive frame (stream end?). Exiting ...", category="VIDEO")
                 break
             
-            # Resize frame for token optimization
-            # cv2.resize expects (width, height)
-            height, width = frame.shape[:2]
-            if width > 1024 or height > 1024:
-                scale = 1024 / max(width, height)
-                new_width = int(width * scale)
-                new_height = int(height * scale)
-                frame = cv2.resize(frame, (new_width, new_height))
-
-            # Encode to JPEG
-            _, buffer = cv2.imencode('.jpg', frame)
-            img_bytes = buffer.tobytes()
+            # Publish as the latest frame (replaces any unsent one)
+            publish(img_bytes, monotonic())
             
-            # Calculate momentum
-            self._calculate_momentum(img_bytes)
-            
-            # Put in queue
-            if self.video_out_queue.full():
-                try:
-                    self.video_out_queue.get_nowait()
-                    self.frame_stats["dropped"] += 1
-                except asyncio.QueueEmpty:
-                    pass
-            
-            await self.video_out_queue.put({
-                "mime_type": "image/jpeg",
-                "data": img_bytes,
-                "timestamp": time.time()
-            })
-            
-            self.frame_stats["captured"] += 1
+            self._stat_captured += 1
             
             # Feed to debug monitor
             if self.debug_monitor:
                 self.debug_monitor.update_video_frame(img_bytes)
             
             # Wait for next capture interval
-            elapsed = time.time() - start_time
+            elapsed = monotonic() - start_time
             wait_time = max(0, VIDEO_CAPTURE_INTERVAL - elapsed)
-            await asyncio.sleep(wait_time)
+            await sleep(wait_time)
 
     async def send_realtime_image(self):
         """
@@ -294,68 +535,85 @@ class VideoPipeline:
         Tracks latency from frame capture to API send.
         Includes connection health checks to prevent sending to dead connections.
         """
-        consecutive_skips = 0
-        max_consecutive_skips = 10  # Drop frames if connection is dead for too long
+        # Hot-loop locals; the bound send is re-resolved only when the session changes (reconnect)
+        video_ready = self._video_ready
+        slot_popleft = self._video_slot.popleft
+        connection_manager = self.connection_manager
+        monotonic = time.monotonic
+        session = None
+        send = None
+        outage_start = outage_end = 0.0  # Last wait for the connection (monotonic)
         
         while True:
-            frame = await self.video_out_queue.get()
+            await video_ready.wait()
             
-            # Check connection health before processing
-            if not self.connection_manager.is_healthy():
-                consecutive_skips += 1
-                if consecutive_skips <= max_consecutive_skips:
-                    if VIDEO_DEBUG or consecutive_skips % 5 == 0:
-                        system_log.info(f"Connection not healthy, skipping frame ({consecutive_skips}/{max_consecutive_skips}). Waiting for reconnection...", category="VIDEO")
-                    continue
-                else:
-                    # Too many skips, drop frame and wait
-                    if VIDEO_DEBUG:
-                        system_log.info(f"Dropping frame due to dead connection (skipped {consecutive_skips} frames)", category="VIDEO")
-                    await asyncio.sleep(1)  # Brief pause before checking again
-                    continue
-            
-            # Reset skip counter on successful health check
-            if consecutive_skips > 0:
+            # While the connection is down, leave the frame in the slot so a newer capture
+            # can replace it; the newest one is popped once the connection is back
+            if not connection_manager.healthy:
                 if VIDEO_DEBUG:
-                    system_log.info(f"Connection restored, resuming frame sending", category="VIDEO")
-                consecutive_skips = 0
+                    system_log.info("Connection not healthy, holding frames until reconnection...", category="VIDEO")
+                outage_start = monotonic()
+                await connection_manager.wait_until_healthy()
+                outage_end = monotonic()
+                continue
             
-            # Calculate latency if timestamp exists
-            if frame.get("timestamp"):
-                latency = time.time() - frame["timestamp"]
-                self.frame_stats["total_latency"] += latency
-                self.frame_stats["max_latency"] = max(self.frame_stats["max_latency"], latency)
-                
+            data, timestamp = slot_popleft()
+            video_ready.clear()
+            
+            now = monotonic()
+            age = now - timestamp
+            
+            # Too old to describe the screen any more: skip the API call, a newer frame is due
+            if age > STALE_FRAME_AGE:
+                self._stat_dropped += 1
+                # Let the next capture through even if the screen has not changed since
+                self._last_frame_thumb = None
                 if VIDEO_DEBUG:
-                    system_log.info(f"Sending frame (latency: {latency:.2f}s)", category="VIDEO")
-                elif latency > 3.0:  # Warn about high latency even without debug mode
-                    system_log.info(f"WARNING: High frame latency: {latency:.2f}s", category="VIDEO")
+                    system_log.info(f"Dropping stale frame (age: {age:.2f}s)", category="VIDEO")
+                continue
+            
+            # Latency from capture to send, minus any time spent waiting for the connection:
+            # an outage is not network slowness and must not drive the JPEG quality down
+            latency = age - max(0.0, outage_end - max(timestamp, outage_start))
+            
+            self._stat_total_latency += latency
+            if latency > self._stat_max_latency:
+                self._stat_max_latency = latency
+            self._adapt_jpeg_quality(latency)
+            
+            if VIDEO_DEBUG:
+                system_log.info(f"Sending frame (latency: {latency:.2f}s)", category="VIDEO")
+            elif latency > 3.0:  # Warn about high latency even without debug mode
+                system_log.info(f"WARNING: High frame latency: {latency:.2f}s", category="VIDEO")
             
-            send_start = time.time()
+            current_session = connection_manager.session
+            if current_session is not session:
+                session = current_session
+                send = session.send_realtime_input if session is not None else None
+            if send is None:
+                continue
+            
+            send_start = now
             try:
-                # Prepare frame for API (remove timestamp)
-                api_frame = {
-                    "mime_type": frame["mime_type"],
-                    "data": frame["data"]
-                }
-                await self.connection_manager.session.send_realtime_input(media=api_frame)
-                self.frame_stats["sent"] += 1
+                # Send raw JPEG bytes as a Blob (no intermediate dict, timestamp stays local)
+                await send(media=types.Blob(data=data, mime_type=IMAGE_MIME_TYPE))
+                self._stat_sent += 1
                 
                 # Feed to debug monitor
                 if self.debug_monitor:
-                    self.debug_monitor.update_video_frame(frame["data"], frame["mime_type"])
+                    self.debug_monitor.update_video_frame(data, IMAGE_MIME_TYPE)
                     self.debug_monitor.report_video_tokens(258)
                 
                 # Emit signal for GUI (if connected)
                 if self.signals:
-                    self.signals.video_frame_ready.emit(frame["data"])  
+                    self.signals.video_frame_ready.emit(data)  
                 
                 # Reset error counter on successful send
                 if self.connection_manager.connection_error_count > 0:
                     self.connection_manager.connection_error_count = 0
                 
                 if VIDEO_DEBUG:
-                    send_time = time.time() - send_start
+                    send_time = time.monotonic() - send_start
                     system_log.info(f"Frame sent to API in {send_time:.3f}s", category="VIDEO")
             except Exception as e:
                 is_dead = self.connection_manager.handle_error(e)
@@ -371,6 +629,18 @@ class VideoPipeline:
                         system_log.info(f"Frame send error traceback: {traceback.format_exc()}", category="VIDEO")
                     await asyncio.sleep(0.1)  # Brief pause before retry
 
+    @property
+    def frame_stats(self) -> Dict:
+        """Snapshot of the frame counters and latency totals."""
+        return {
+            "captured": self._stat_captured,
+            "sent": self._stat_sent,
+            "dropped": self._stat_dropped,
+            "unchanged": self._stat_unchanged,
+            "total_latency": self._stat_total_latency,
+            "max_latency": self._stat_max_latency,
+        }
+
     async def video_stats_task(self):
         """Periodically print video pipeline statistics for debugging."""
         if not VIDEO_DEBUG:
@@ -378,13 +648,15 @@ class VideoPipeline:
         
         while True:
             await asyncio.sleep(30.0)  # Print stats every 30 seconds
-            if self.frame_stats["sent"] > 0:
-                avg_latency = self.frame_stats["total_latency"] / self.frame_stats["sent"]
-                system_log.info(f"Captured: {self.frame_stats['captured']}, "
-                      f"Sent: {self.frame_stats['sent']}, "
-                      f"Dropped: {self.frame_stats['dropped']}, "
+            stats = self.frame_stats
+            if stats["sent"] > 0:
+                avg_latency = stats["total_latency"] / stats["sent"]
+                system_log.info(f"Captured: {stats['captured']}, "
+                      f"Sent: {stats['sent']}, "
+                      f"Dropped: {stats['dropped']}, "
+                      f"Unchanged: {stats['unchanged']}, "
                       f"Avg Latency: {avg_latency:.2f}s, "
-                      f"Max Latency: {self.frame_stats['max_latency']:.2f}s, "
+                      f"Max Latency: {stats['max_latency']:.2f}s, "
                       f"Momentum: {self.momentum_score:.1f}", category="VIDEO")
     
     def list_windows(self) -> List[Dict]: